@@ -7,6 +7,7 @@ import hashlib
 import json
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 
@@ -23,17 +24,24 @@ class ServerConfig:
     env: tuple[tuple[str, str], ...] = field(default_factory=tuple)
     auth: Literal["none", "oauth"] = "none"
 
-    @property
+    @cached_property
     def id(self) -> str:
-        """Generate a unique ID for this server configuration."""
+        """Generate a unique ID for this server configuration.
+
+        Computed on first access; the dataclass is frozen, so it never changes.
+        """
         # Create a stable string representation for hashing
         key = f"{self.command}|{self.args}|{self.url}|{self.transport}|{sorted(self.env)}|{self.auth}"
         return hashlib.sha256(key.encode()).hexdigest()
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualTool:
-    """A tool exposed by the Gateway."""
+    """A tool exposed by the Gateway.
+
+    Slotted: the gateway reads these fields on every call_tool, and registries
+    can hold many tools.
+    """
     name: str
     description: str | None
     input_schema: dict[str, Any]
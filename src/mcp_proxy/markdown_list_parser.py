@@ -12,8 +12,85 @@ Extracts structured data from markdown-formatted numbered lists like:
 """
 
 import re
+import sys
 import typing as t
 
+# Item boundaries: a list marker at the start of the text or of a line.
+# These stay as regexes rather than line-by-line str loops: a hand-written
+# splitter is no faster on typical tool output, and "\s+" after the marker
+# may span newlines, which a per-line loop does not reproduce.
+_NUMBERED_ITEM_SPLIT = re.compile(r"(?:^|\n)\d+\.\s+")
+_BULLET_ITEM_SPLIT = re.compile(r"(?:^|\n)[-*]\s+")
+
+
+class _CompiledField(t.NamedTuple):
+    """A field extraction pattern with its regex compiled once per parse."""
+
+    name: str
+    regex: re.Pattern[str]
+    convert: t.Callable[[str], t.Any]
+    multiline: bool
+    required: bool
+
+
+def _compile_patterns(patterns: dict[str, dict[str, t.Any]]) -> list[_CompiledField]:
+    """Compile each field's regex once so list items reuse the Pattern objects.
+
+    Field names are interned because they become the keys of every extracted
+    item. Fields without a regex are dropped; they can never be extracted.
+    """
+    compiled = []
+    for field_name, pattern_config in patterns.items():
+        regex = pattern_config.get("regex")
+        if not regex:
+            continue
+        multiline = bool(pattern_config.get("multiline"))
+        compiled.append(
+            _CompiledField(
+                sys.intern(field_name),
+                re.compile(regex, re.MULTILINE if multiline else 0),
+                _make_converter(pattern_config),
+                multiline,
+                bool(pattern_config.get("required")),
+            ),
+        )
+    return compiled
+
+
+def _parse_items(
+    items: list[str],
+    item_patterns: dict[str, dict[str, t.Any]],
+) -> list[dict[str, t.Any]]:
+    """Extract fields from each item, keeping items that have all required fields.
+
+    Items are stripped here; blank ones are skipped.
+    """
+    if any(config.get("required") and not config.get("regex") for config in item_patterns.values()):
+        # A required field without a regex can never be found
+        return []
+
+    fields = _compile_patterns(item_patterns)
+    # Match required fields first so an item missing one is dropped before any
+    # optional pattern runs; results still follow the configured field order.
+    match_order = sorted(fields, key=lambda field: not field.required)
+    reorder = match_order != fields
+
+    results = []
+    for raw_item in items:
+        item_text = raw_item.strip()
+        if not item_text:
+            continue
+        item_data = _extract_fields(item_text, match_order)
+        if not item_data:
+            continue
+        if reorder:
+            item_data = {
+                field.name: item_data[field.name] for field in fields if field.name in item_data
+            }
+        results.append(item_data)
+
+    return results
+
 
 def parse_numbered_list(
     text: str,
@@ -53,25 +130,10 @@ def parse_numbered_list(
         return []
 
     # Split by numbered markers (1., 2., etc.) at start of line
-    # Keep the content after each marker
-    items = re.split(r'(?:^|\n)\d+\.\s+', text)
-    items = [item.strip() for item in items if item.strip()]
-
-    results = []
-    for item_text in items:
-        item_data = _extract_fields(item_text, item_patterns)
-
-        # Only include items that have all required fields
-        has_required = all(
-            field_name in item_data
-            for field_name, config in item_patterns.items()
-            if config.get("required")
-        )
-
-        if has_required and item_data:
-            results.append(item_data)
-
-    return results
+    # Keep the content after each marker. Text without a "." cannot contain a
+    # marker, so skip the regex and treat it as a single item.
+    items = _NUMBERED_ITEM_SPLIT.split(text) if "." in text else [text]
+    return _parse_items(items, item_patterns)
 
 
 def parse_bullet_list(
@@ -85,91 +147,111 @@ def parse_bullet_list(
     if not text or not item_patterns:
         return []
 
-    # Split by bullet markers (- or *) at start of line
-    items = re.split(r'(?:^|\n)[-*]\s+', text)
-    items = [item.strip() for item in items if item.strip()]
-
-    results = []
-    for item_text in items:
-        item_data = _extract_fields(item_text, item_patterns)
-
-        has_required = all(
-            field_name in item_data
-            for field_name, config in item_patterns.items()
-            if config.get("required")
-        )
-
-        if has_required and item_data:
-            results.append(item_data)
-
-    return results
+    # Split by bullet markers (- or *) at start of line, checking for a
+    # marker with plain substring tests before running the regex
+    if text.startswith(("-", "*")) or "\n-" in text or "\n*" in text:
+        items = _BULLET_ITEM_SPLIT.split(text)
+    else:
+        items = [text]
+    return _parse_items(items, item_patterns)
 
 
 def _extract_fields(
     item_text: str,
-    patterns: dict[str, dict[str, t.Any]],
-) -> dict[str, t.Any]:
-    """Extract fields from a single list item using patterns."""
-    item_data: dict[str, t.Any] = {}
-
-    for field_name, pattern_config in patterns.items():
-        regex = pattern_config.get("regex")
-        if not regex:
-            continue
+    fields: list[_CompiledField],
+) -> dict[str, t.Any] | None:
+    """Extract fields from a single list item using compiled patterns.
 
-        flags = re.MULTILINE if pattern_config.get("multiline") else 0
+    Returns None as soon as a required field fails to match.
+    """
+    item_data: dict[str, t.Any] = {}
 
-        if pattern_config.get("multiline"):
+    # Each field is matched on its own rather than through one combined
+    # alternation: an alternation consumes text leftmost-first, so a field
+    # whose match overlaps another (e.g. "#(\d+)" inside a bold title) would
+    # be silently dropped.
+    for field_name, regex, convert, multiline, required in fields:
+        if multiline:
             # Find all matching lines
-            matches = re.findall(regex, item_text, flags)
+            matches = regex.findall(item_text)
             if matches:
                 # If regex has groups, findall returns the groups
                 if isinstance(matches[0], tuple):
                     matches = [m[0] for m in matches]
                 value = "\n".join(str(m) for m in matches)
-                item_data[field_name] = _transform_value(value, pattern_config)
+                item_data[field_name] = convert(value)
+            elif required:
+                return None
         else:
             # Find first match
-            match = re.search(regex, item_text, flags)
+            match = regex.search(item_text)
             if match:
                 # Use first capture group if present, else full match
                 value = match.group(1) if match.lastindex else match.group(0)
-                item_data[field_name] = _transform_value(value, pattern_config)
+                item_data[field_name] = convert(value)
+            elif required:
+                return None
 
     return item_data
 
 
-def _transform_value(value: str, config: dict[str, t.Any]) -> t.Any:
-    """Apply transformations and type conversions to extracted value."""
-    # Apply string transformations first
-    transform = config.get("transform")
-    if transform == "remove_commas":
-        value = value.replace(",", "")
-    elif transform == "lowercase":
-        value = value.lower()
-    elif transform == "uppercase":
-        value = value.upper()
-    elif transform == "strip":
-        value = value.strip()
-
-    # Type conversion
-    value_type = config.get("type", "string")
-    if value_type == "integer":
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return 0
-    elif value_type == "number":
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return 0.0
-    elif value_type == "boolean":
-        return value.lower() in ("true", "yes", "1", "on")
+def _to_integer(value: str) -> int:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _to_number(value: str) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _to_boolean(value: str) -> bool:
+    return value.lower() in ("true", "yes", "1", "on")
+
+
+def _remove_commas(value: str) -> str:
+    return value.replace(",", "")
+
 
+_STRING_TRANSFORMS: dict[str, t.Callable[[str], str]] = {
+    "remove_commas": _remove_commas,
+    "lowercase": str.lower,
+    "uppercase": str.upper,
+    "strip": str.strip,
+}
+
+_TYPE_CONVERSIONS: dict[str, t.Callable[[str], t.Any]] = {
+    "integer": _to_integer,
+    "number": _to_number,
+    "boolean": _to_boolean,
+}
+
+
+def _identity(value: str) -> str:
     return value
 
 
+def _make_converter(config: dict[str, t.Any]) -> t.Callable[[str], t.Any]:
+    """Resolve a field's transform and type into one function.
+
+    The string transform is applied first, then the type conversion, so
+    per-item extraction does no config lookups.
+    """
+    # Non-string values (e.g. a list) are ignored rather than used as keys
+    transform_name = config.get("transform")
+    type_name = config.get("type", "string")
+    transform = _STRING_TRANSFORMS.get(transform_name) if isinstance(transform_name, str) else None
+    convert = _TYPE_CONVERSIONS.get(type_name) if isinstance(type_name, str) else None
+
+    if transform and convert:
+        return lambda value: convert(transform(value))
+    return transform or convert or _identity
+
+
 def extract_markdown_list(
     text: str,
     config: dict[str, t.Any],
@@ -1,5 +1,6 @@
 """Create a local SSE server that proxies requests to a stdio MCP server."""
 
+import asyncio
 import contextlib
 import logging
 from collections.abc import AsyncIterator, Awaitable, Callable
@@ -34,7 +35,12 @@ from starlette.routing import BaseRoute, Mount, Route
 from starlette.types import Receive, Scope, Send
 
 from .config_loader import ServerConfig, VirtualTool
-from .output_transformer import apply_output_projection, get_structured_content
+from .output_transformer import (
+    OutputProjection,
+    compile_output_projection,
+    get_structured_content,
+    project_output,
+)
 from .markdown_list_parser import extract_markdown_list
 from .tool_versioning import (
     handle_validation_failure,
@@ -174,20 +180,33 @@ async def _validate_all_backends(
         if tool.validation_mode != "skip" and tool.expected_schema_hash:
             tools_by_backend.setdefault(tool.server_id, []).append(tool)
 
-    # Validate each backend
+    # Validate each connected backend
+    connected: dict[str, list[VirtualTool]] = {}
     for server_id, tools in tools_by_backend.items():
         if server_id not in active_backends:
             logger.warning("Backend %s not connected, skipping validation", server_id)
             continue
-
-        backend = active_backends[server_id]
         logger.info("Validating %d tools against backend %s", len(tools), server_id[:8])
+        connected[server_id] = tools
+
+    # Each backend's list_tools is an independent round trip, so query them
+    # concurrently; validate_backend_tools turns backend errors into results.
+    all_results = await asyncio.gather(
+        *(
+            validate_backend_tools(active_backends[server_id], tools, server_id)
+            for server_id, tools in connected.items()
+        )
+    )
 
-        results = await validate_backend_tools(backend, tools, server_id)
+    for tools, results in zip(connected.values(), all_results, strict=True):
+        # First tool registered under a name wins, as it does in call_tool
+        tools_by_name: dict[str, VirtualTool] = {}
+        for tool in tools:
+            tools_by_name.setdefault(tool.name, tool)
 
         for result in results:
             # Find the tool and update its status
-            tool = next((t for t in tools if t.name == result.tool_name), None)
+            tool = tools_by_name.get(result.tool_name)
             if tool:
                 tool.validation_status = result.status
                 tool.computed_schema_hash = result.actual_hash
@@ -266,6 +285,13 @@ async def run_mcp_server(
         # Validate backend tools against expected schemas
         await _validate_all_backends(active_backends, virtual_tools)
 
+        # Resolve tools and their output schemas once rather than on every
+        # call_tool; the first tool registered under a name wins
+        tools_by_name: dict[str, tuple[VirtualTool, OutputProjection | None]] = {}
+        for vt in virtual_tools:
+            if vt.name not in tools_by_name:
+                tools_by_name[vt.name] = (vt, compile_output_projection(vt.output_schema))
+
         # Create Aggregator Server
         gateway = MCPServerSDK("mcp-gateway")
 
@@ -283,9 +309,10 @@ async def run_mcp_server(
         @gateway.call_tool()
         async def call_tool(name: str, arguments: dict) -> CallToolResult:
             # Find the tool
-            tool = next((t for t in virtual_tools if t.name == name), None)
-            if not tool:
+            entry = tools_by_name.get(name)
+            if not entry:
                 raise ValueError(f"Tool not found: {name}")
+            tool, output_projection = entry
 
             # Check validation status (strict mode tools disabled on validation failure)
             if tool.validation_mode == "strict" and tool.validation_status == "error":
@@ -370,7 +397,7 @@ async def run_mcp_server(
                 if structured:
                     # Apply output schema projection if defined
                     if tool.output_schema and isinstance(structured, dict):
-                        projected = apply_output_projection(structured, tool.output_schema)
+                        projected = project_output(structured, output_projection)
                     else:
                         projected = structured
 
@@ -9,14 +9,55 @@ This module provides functions for:
 Uses the jsonpath-ng library for JSONPath parsing and evaluation.
 """
 
-import copy
+import re
 import typing as t
 
-from jsonpath_ng import parse as parse_jsonpath
-from jsonpath_ng.exceptions import JsonPathParserError
-
 from mcp_proxy.json_detector import extract_json_from_tool_result
 
+if t.TYPE_CHECKING:
+    from jsonpath_ng import JSONPath
+
+# "$.a.b.c" with plain identifiers only: no indexes, wildcards or filters.
+_DOTTED_PATH = re.compile(r"\$(?:\.[A-Za-z_][A-Za-z0-9_]*)+")
+# The subset source_field paths use in practice: keys, list indexes and [*].
+_SIMPLE_PATH = re.compile(r"\$(?:\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\]|\[\*\])+")
+_SIMPLE_PATH_STEP = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]|\[\*\]")
+
+# Default for single-lookup dict.get() where None is a legitimate value
+_MISSING = object()
+
+# Parsed JSONPath expressions keyed by source string. A plain dict avoids
+# lru_cache's recency bookkeeping on every lookup; it is cleared outright if a
+# registry ever produces more distinct paths than the bound.
+_JSONPATH_CACHE: dict[str, "JSONPath | None"] = {}
+_JSONPATH_CACHE_MAX = 4096
+
+
+def _compile_jsonpath(path: str) -> "JSONPath | None":
+    """Parse a JSONPath expression once and reuse it for every later call.
+
+    Returns None if the expression cannot be parsed. jsonpath-ng is imported
+    here rather than at module level, so importing this module (and serving
+    paths that never reach jsonpath-ng) does not pay for loading its parser.
+    """
+    try:
+        return _JSONPATH_CACHE[path]
+    except KeyError:
+        pass
+
+    from jsonpath_ng import parse as parse_jsonpath
+    from jsonpath_ng.exceptions import JsonPathParserError
+
+    try:
+        jsonpath_expr = parse_jsonpath(path)
+    except JsonPathParserError:
+        jsonpath_expr = None
+
+    if len(_JSONPATH_CACHE) >= _JSONPATH_CACHE_MAX:
+        _JSONPATH_CACHE.clear()
+    _JSONPATH_CACHE[path] = jsonpath_expr
+    return t.cast("JSONPath | None", jsonpath_expr)
+
 
 def extract_value(data: t.Any, path: str) -> t.Any:  # noqa: ANN401
     """Extract a value from nested data using a standard JSONPath expression.
@@ -34,22 +75,29 @@ def extract_value(data: t.Any, path: str) -> t.Any:  # noqa: ANN401
         The extracted value, or None if path doesn't match.
         For wildcard expressions, returns a list of matched values.
     """
-    if not path or not data:
+    if not path:
         return None
 
-    try:
-        jsonpath_expr = parse_jsonpath(path)
-    except JsonPathParserError:
+    # Check if this is a wildcard expression by looking for [*] in the path
+    return _find_value(data, _compile_jsonpath(path), is_wildcard="[*]" in path)
+
+
+def _find_value(
+    data: t.Any,  # noqa: ANN401
+    jsonpath_expr: "JSONPath | None",
+    *,
+    is_wildcard: bool,
+) -> t.Any:  # noqa: ANN401
+    """Evaluate an already-parsed JSONPath expression against data."""
+    if jsonpath_expr is None or not data:
         return None
 
-    matches = jsonpath_expr.find(data)
+    # jsonpath-ng is untyped; find() returns a list of DatumInContext
+    matches: list[t.Any] = jsonpath_expr.find(data)  # type: ignore[no-untyped-call]
 
     if not matches:
         return None
 
-    # Check if this is a wildcard expression by looking for [*] in the path
-    is_wildcard = "[*]" in path
-
     if is_wildcard:
         # Return list of all matched values
         return [match.value for match in matches]
@@ -62,6 +110,172 @@ def extract_value(data: t.Any, path: str) -> t.Any:  # noqa: ANN401
     return [match.value for match in matches]
 
 
+class _FieldProjection(t.NamedTuple):
+    """One output property with its source_field resolved ahead of time."""
+
+    name: str
+    has_source: bool
+    expr: "JSONPath | None" = None
+    is_wildcard: bool = False
+    # Dict keys to walk directly when source_field is a plain dotted path
+    keys: tuple[str, ...] | None = None
+    # Steps for _run_steps when source_field is in the simple subset
+    steps: tuple[str | int | None, ...] | None = None
+    # Per-element projection for arrays of objects; None for plain fields
+    item_fields: "OutputProjection | None" = None
+
+
+OutputProjection = tuple[_FieldProjection, ...]
+
+
+def compile_output_projection(
+    output_schema: dict[str, t.Any] | None,
+) -> OutputProjection | None:
+    """Resolve an output schema into a projection plan that can be reused per call.
+
+    Walks output_schema["properties"] once and parses every source_field, so
+    projecting a tool result does no schema lookups or JSONPath parsing.
+
+    Args:
+        output_schema: The output schema with optional source_field mappings
+
+    Returns:
+        The projection plan, or None if the schema has no properties to
+        project (content then passes through unchanged)
+    """
+    if not output_schema or "properties" not in output_schema:
+        return None
+
+    properties = output_schema.get("properties", {})
+    if not isinstance(properties, dict):
+        return None
+
+    return _compile_properties(properties, nested_items=True)
+
+
+def _compile_properties(
+    properties: dict[str, t.Any],
+    *,
+    nested_items: bool,
+) -> OutputProjection:
+    """Compile each property definition; nested_items enables array-of-objects projection."""
+    fields = []
+    for field_name, field_schema in properties.items():
+        if not isinstance(field_schema, dict):
+            continue
+
+        source_field = field_schema.get("source_field")
+        if not source_field:
+            fields.append(_FieldProjection(name=field_name, has_source=False))
+            continue
+
+        item_fields = None
+        items_schema = field_schema.get("items")
+        if (
+            nested_items
+            and isinstance(items_schema, dict)
+            and items_schema.get("type") == "object"
+            and "properties" in items_schema
+        ):
+            item_fields = _compile_properties(items_schema["properties"], nested_items=False)
+
+        jsonpath_expr = _compile_jsonpath(source_field)
+        keys = steps = None
+        if jsonpath_expr is not None:
+            if _DOTTED_PATH.fullmatch(source_field):
+                keys = tuple(source_field[2:].split("."))
+            elif _SIMPLE_PATH.fullmatch(source_field):
+                steps = _compile_steps(source_field)
+
+        fields.append(
+            _FieldProjection(
+                name=field_name,
+                has_source=True,
+                expr=jsonpath_expr,
+                is_wildcard="[*]" in source_field,
+                keys=keys,
+                steps=steps,
+                item_fields=item_fields,
+            ),
+        )
+    return tuple(fields)
+
+
+def _compile_steps(path: str) -> tuple[str | int | None, ...]:
+    """Split a simple-subset path into steps: a key, a list index, or None for [*]."""
+    return tuple(
+        key if key else int(index) if index else None
+        for key, index in _SIMPLE_PATH_STEP.findall(path)
+    )
+
+
+def _run_steps(data: t.Any, steps: tuple[str | int | None, ...]) -> list[t.Any] | None:  # noqa: ANN401
+    """Evaluate compiled steps, returning matched values like JSONPath find().
+
+    Returns None when an index or [*] meets something other than a list;
+    jsonpath-ng has its own rules for those shapes, so the caller defers to it.
+    """
+    values = [data]
+    for step in steps:
+        matched = []
+        for value in values:
+            if isinstance(step, str):
+                if isinstance(value, dict):
+                    found = value.get(step, _MISSING)
+                    if found is not _MISSING:
+                        matched.append(found)
+            elif not isinstance(value, list):
+                return None
+            elif step is None:
+                matched.extend(value)
+            elif step < len(value):
+                matched.append(value[step])
+        values = matched
+    return values
+
+
+def _field_value(data: t.Any, field: _FieldProjection) -> t.Any:  # noqa: ANN401
+    """Extract a compiled field's source value from data.
+
+    Plain dotted paths are walked key by key and other simple-subset paths run
+    through _run_steps; both give the same result as jsonpath-ng without
+    building match objects. Anything else uses the parsed expression.
+    """
+    if field.keys is not None:
+        return _walk_keys(data, field.keys)
+
+    if field.steps is not None and data:
+        matches = _run_steps(data, field.steps)
+        if matches is not None:
+            return _collapse_matches(matches, is_wildcard=field.is_wildcard)
+
+    return _find_value(data, field.expr, is_wildcard=field.is_wildcard)
+
+
+def _walk_keys(data: t.Any, keys: tuple[str, ...]) -> t.Any:  # noqa: ANN401
+    """Follow dict keys from data, returning None if any step is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key, _MISSING)
+        if data is _MISSING:
+            return None
+    return data
+
+
+def _collapse_matches(values: list[t.Any], *, is_wildcard: bool) -> t.Any:  # noqa: ANN401
+    """Shape matched values the way extract_value reports them.
+
+    No match is None, a single non-wildcard match is the bare value, and
+    anything else is the list of values.
+    """
+    if not values:
+        return None
+    if len(values) == 1 and not is_wildcard:
+        return values[0]
+    return values
+
+
 def apply_output_projection(
     structured_content: dict[str, t.Any],
     output_schema: dict[str, t.Any],
@@ -72,6 +286,9 @@ def apply_output_projection(
     - If has source_field: extract from that JSONPath
     - If no source_field: passthrough from top-level if exists
 
+    Callers that project many results through the same schema should compile
+    it once with compile_output_projection and use project_output instead.
+
     Args:
         structured_content: The original structured response from the tool
         output_schema: The output schema with optional source_field mappings
@@ -79,61 +296,57 @@ def apply_output_projection(
     Returns:
         A new dict with transformed/projected content
     """
-    if not output_schema or "properties" not in output_schema:
-        return structured_content
+    return project_output(structured_content, compile_output_projection(output_schema))
 
-    properties = output_schema.get("properties", {})
-    if not isinstance(properties, dict):
+
+def project_output(
+    structured_content: dict[str, t.Any],
+    projection: OutputProjection | None,
+) -> dict[str, t.Any]:
+    """Transform structured content according to a compiled projection plan.
+
+    Args:
+        structured_content: The original structured response from the tool
+        projection: A plan from compile_output_projection, or None to passthrough
+
+    Returns:
+        A new dict with transformed/projected content
+    """
+    if projection is None:
         return structured_content
 
     result: dict[str, t.Any] = {}
 
-    for field_name, field_schema in properties.items():
-        if not isinstance(field_schema, dict):
+    for field in projection:
+        if not field.has_source:
+            # No source_field - passthrough from top-level if present
+            value = structured_content.get(field.name, _MISSING)
+            if value is not _MISSING:
+                result[field.name] = value
             continue
 
-        source_field = field_schema.get("source_field")
-
-        if source_field:
-            # Check if this is an array of objects with nested projections
-            items_schema = field_schema.get("items")
-            if (
-                isinstance(items_schema, dict)
-                and items_schema.get("type") == "object"
-                and "properties" in items_schema
-            ):
-                # Extract array elements first
-                array_elements = extract_value(structured_content, source_field)
-                if isinstance(array_elements, list):
-                    # Project each element according to items schema
-                    result[field_name] = [
-                        _project_element(elem, items_schema["properties"])
-                        for elem in array_elements
-                    ]
-                # Skip field if source path doesn't exist (don't include None)
-            else:
-                # Simple extraction - only include if value exists
-                value = extract_value(structured_content, source_field)
-                if value is not None:
-                    result[field_name] = value
-                # Skip field if source path doesn't exist
-        else:
-            # No source_field - passthrough from top-level if present
-            if field_name in structured_content:
-                result[field_name] = structured_content[field_name]
+        value = _field_value(structured_content, field)
+        if field.item_fields is not None:
+            # Array of objects: project each element according to items schema
+            if isinstance(value, list):
+                result[field.name] = [_project_element(elem, field.item_fields) for elem in value]
+            # Skip field if source path doesn't exist (don't include None)
+        elif value is not None:
+            # Simple extraction - only include if value exists
+            result[field.name] = value
 
     return result
 
 
-def _project_element(element: t.Any, properties: dict[str, t.Any]) -> dict[str, t.Any]:  # noqa: ANN401
-    """Project a single element according to property definitions.
+def _project_element(element: t.Any, item_fields: OutputProjection) -> dict[str, t.Any]:  # noqa: ANN401
+    """Project a single element according to compiled item fields.
 
     Used for array-of-objects transformations where each element
     needs fields extracted according to nested source_field paths.
 
     Args:
         element: A single element from the source array
-        properties: The properties schema for each item
+        item_fields: The compiled properties for each item
 
     Returns:
         A new dict with projected fields from the element
@@ -143,18 +356,15 @@ def _project_element(element: t.Any, properties: dict[str, t.Any]) -> dict[str,
 
     result: dict[str, t.Any] = {}
 
-    for field_name, field_schema in properties.items():
-        if not isinstance(field_schema, dict):
-            continue
-
-        source_field = field_schema.get("source_field")
-
-        if source_field:
+    for field in item_fields:
+        if field.has_source:
             # Extract from the element using the path
-            result[field_name] = extract_value(element, source_field)
-        elif field_name in element:
+            result[field.name] = _field_value(element, field)
+        else:
             # Passthrough if present
-            result[field_name] = element[field_name]
+            value = element.get(field.name, _MISSING)
+            if value is not _MISSING:
+                result[field.name] = value
 
     return result
 
@@ -162,7 +372,7 @@ def _project_element(element: t.Any, properties: dict[str, t.Any]) -> dict[str,
 def strip_source_fields(schema: dict[str, t.Any]) -> dict[str, t.Any]:
     """Remove source_field metadata from schema before advertising to LLM.
 
-    Returns a deep copy with source_field stripped from all properties.
+    Returns a copy with source_field stripped from all properties.
     This ensures the LLM sees the clean output structure, not internal mappings.
 
     Args:
@@ -174,26 +384,24 @@ def strip_source_fields(schema: dict[str, t.Any]) -> dict[str, t.Any]:
     if not schema:
         return schema
 
-    result = copy.deepcopy(schema)
-    _strip_source_fields_recursive(result)
-    return result
-
+    return t.cast("dict[str, t.Any]", _without_source_fields(schema))
 
-def _strip_source_fields_recursive(obj: t.Any) -> None:  # noqa: ANN401
-    """Recursively strip source_field from a schema object in-place."""
-    if not isinstance(obj, dict):
-        return
 
-    # Remove source_field if present at this level
-    obj.pop("source_field", None)
+def _without_source_fields(obj: t.Any) -> t.Any:  # noqa: ANN401
+    """Rebuild dicts and lists without source_field keys in a single pass.
 
-    # Recurse into nested structures
-    for value in obj.values():
-        if isinstance(value, dict):
-            _strip_source_fields_recursive(value)
-        elif isinstance(value, list):
-            for item in value:
-                _strip_source_fields_recursive(item)
+    Scalars are shared with the input; they are immutable, so the result is
+    still independent of the original schema.
+    """
+    if isinstance(obj, dict):
+        return {
+            key: _without_source_fields(value)
+            for key, value in obj.items()
+            if key != "source_field"
+        }
+    if isinstance(obj, list):
+        return [_without_source_fields(item) for item in obj]
+    return obj
 
 
 def get_structured_content(
@@ -3,7 +3,6 @@
 This server is created independent of any transport mechanism.
 """
 
-import copy
 import logging
 import typing as t
 
@@ -12,8 +11,9 @@ from mcp.client.session import ClientSession
 from typing import TypedDict
 
 from .output_transformer import (
-    apply_output_projection,
+    compile_output_projection,
     get_structured_content,
+    project_output,
     strip_source_fields,
 )
 
@@ -103,6 +103,26 @@ async def create_proxy_server(
     if capabilities.tools:
         logger.debug("Capabilities: adding Tools...")
 
+        # Resolve output schemas once here rather than on every call_tool
+        output_projections = {
+            name: compile_output_projection(override.get("output_schema"))
+            for name, override in (tool_overrides or {}).items()
+        }
+        # Stripped copies advertised by list_tools. Every response shares these
+        # dicts, so nothing downstream may mutate them.
+        advertised_output_schemas = {
+            name: strip_source_fields(override["output_schema"])
+            for name, override in (tool_overrides or {}).items()
+            if override.get("output_schema")
+        }
+        # Input fields removed from each advertised schema: hidden ones plus
+        # those the proxy fills in from defaults
+        hidden_input_fields = {
+            name: frozenset(override.get("hide_fields", ()))
+            | frozenset(override.get("defaults", {}))
+            for name, override in (tool_overrides or {}).items()
+        }
+
         async def _list_tools(_: t.Any) -> types.ServerResult:  # noqa: ANN401
             result = await remote_app.list_tools()
             
@@ -117,29 +137,26 @@ async def create_proxy_server(
                     new_name = override.get("rename", tool.name)
                     new_description = override.get("description", tool.description)
                     
-                    # Deep copy schema to avoid modifying original if it's shared (unlikely but safe)
-                    new_input_schema = copy.deepcopy(tool.inputSchema)
-                    
-                    defaults = override.get("defaults", {})
-                    hide_fields = override.get("hide_fields", [])
+                    hidden = hidden_input_fields[tool.name]
                     output_schema = override.get("output_schema")
-                    
-                    if "properties" in new_input_schema and isinstance(new_input_schema["properties"], dict):
-                        props = new_input_schema["properties"]
-                        # Remove hidden fields
-                        for field in hide_fields:
-                            props.pop(field, None)
-                        # Remove fields that have defaults
-                        for field in defaults:
-                            props.pop(field, None)
-                    
-                    if "required" in new_input_schema and isinstance(new_input_schema["required"], list):
+
+                    # Rebuild only the containers that change. Property definitions
+                    # stay shared with the upstream tool, which is parsed fresh for
+                    # every list_tools response and then replaced by this one.
+                    new_input_schema = dict(tool.inputSchema)
+
+                    if isinstance(new_input_schema.get("properties"), dict):
+                        # Remove hidden fields and fields that have defaults
+                        new_input_schema["properties"] = {
+                            field: prop
+                            for field, prop in new_input_schema["properties"].items()
+                            if field not in hidden
+                        }
+
+                    if isinstance(new_input_schema.get("required"), list):
                         reqs = new_input_schema["required"]
                         # Filter out hidden/defaulted fields from required list
-                        new_input_schema["required"] = [
-                            f for f in reqs 
-                            if f not in hide_fields and f not in defaults
-                        ]
+                        new_input_schema["required"] = [f for f in reqs if f not in hidden]
 
                     tool_args = {
                         "name": new_name,
@@ -149,7 +166,7 @@ async def create_proxy_server(
                     
                     # Apply outputSchema override if present (strip source_field metadata)
                     if output_schema:
-                        tool_args["outputSchema"] = strip_source_fields(output_schema)
+                        tool_args["outputSchema"] = advertised_output_schemas[tool.name]
                     # Otherwise pass through existing outputSchema (if SDK supports it)
                     elif hasattr(tool, "outputSchema") and tool.outputSchema:
                         tool_args["outputSchema"] = tool.outputSchema
@@ -200,7 +217,7 @@ async def create_proxy_server(
 
                 # Process output schema if defined
                 if active_override and active_override.get("output_schema"):
-                    output_schema = active_override["output_schema"]
+                    projection = output_projections[original_name]
 
                     # Get structured content - either existing or extracted from text
                     structured = None
@@ -223,9 +240,7 @@ async def create_proxy_server(
 
                     # Apply projection and set structuredContent
                     if structured and isinstance(structured, dict):
-                        result.structuredContent = apply_output_projection(
-                            structured, output_schema
-                        )
+                        result.structuredContent = project_output(structured, projection)
 
                 return types.ServerResult(result)
             except Exception as e:  # noqa: BLE001
@@ -1,5 +1,5 @@
-import json
 import logging
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional
@@ -47,9 +47,9 @@ class FileRegistryStorage(RegistryStorage):
             return None
         
         try:
-            with open(card_path, "r") as f:
-                data = json.load(f)
-                return AgentCard.model_validate(data)
+            # Let pydantic parse the JSON bytes directly rather than building
+            # an intermediate dict with the json module first
+            return AgentCard.model_validate_json(card_path.read_bytes())
         except Exception as e:
             logger.error(f"Failed to load card {id}:{version}: {e}")
             return None
@@ -66,18 +66,25 @@ class FileRegistryStorage(RegistryStorage):
                 return []
             paths_to_search = [search_path]
         else:
-            paths_to_search = [p for p in self.root_dir.iterdir() if p.is_dir()]
+            # scandir reports entry types from the directory listing itself,
+            # so this needs no extra stat call per entry
+            with os.scandir(self.root_dir) as entries:
+                paths_to_search = [Path(entry.path) for entry in entries if entry.is_dir()]
 
         for id_dir in paths_to_search:
-            for version_file in id_dir.glob("*.json"):
+            with os.scandir(id_dir) as entries:
+                version_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+            for version_file in version_files:
                 try:
-                    with open(version_file, "r") as f:
-                        data = json.load(f)
-                        card = AgentCard.model_validate(data)
-                        # Double check ID matches if filter provided
-                        if id_filter and card.name != id_filter:
-                            continue
-                        cards.append(card)
+                    card = AgentCard.model_validate_json(version_file.read_bytes())
+                    # Double check ID matches if filter provided
+                    if id_filter and card.name != id_filter:
+                        continue
+                    cards.append(card)
                 except Exception as e:
                     logger.warning(f"Skipping invalid card file {version_file}: {e}")
                     continue
@@ -133,6 +133,10 @@ async def validate_backend_tools(
     Returns:
         List of validation results for each expected tool.
     """
+    # Nothing to compare if every tool opts out, so don't query the backend
+    if all(tool.validation_mode == "skip" for tool in expected_tools):
+        return [_skipped_result(tool) for tool in expected_tools]
+
     try:
         result = await backend.list_tools()
         backend_tools = {t.name: t for t in result.tools}
@@ -153,14 +157,7 @@ async def validate_backend_tools(
     for tool in expected_tools:
         # Skip validation for tools with skip mode
         if tool.validation_mode == "skip":
-            results.append(
-                ToolValidationResult(
-                    tool_name=tool.name,
-                    status="valid",
-                    expected_hash=None,
-                    actual_hash=None,
-                )
-            )
+            results.append(_skipped_result(tool))
             continue
 
         # Determine the backend tool name
@@ -207,6 +204,16 @@ async def validate_backend_tools(
     return results
 
 
+def _skipped_result(tool: "VirtualTool") -> ToolValidationResult:
+    """Result for a tool whose validation mode is skip; it is never hashed."""
+    return ToolValidationResult(
+        tool_name=tool.name,
+        status="valid",
+        expected_hash=None,
+        actual_hash=None,
+    )
+
+
 def _compute_drift_details(tool: "VirtualTool", backend_tool: "Tool") -> dict[str, Any]:
     """Compute details about what changed between expected and actual tool."""
     details: dict[str, Any] = {}
@@ -0,0 +1,26 @@
+"""Shared fixtures for the test suite."""
+
+import json
+import pathlib
+
+import pytest
+
+_FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
+_FIXTURES_PATH = _FIXTURES_DIR / "mcp_server_outputs.json"
+
+
+def _load_json_fixture(path: pathlib.Path) -> dict:
+    """Parse a JSON fixture file."""
+    return json.loads(path.read_text())
+
+
+@pytest.fixture(scope="session")
+def real_server_outputs() -> dict:
+    """Load real MCP server outputs from fixtures once per test session."""
+    return _load_json_fixture(_FIXTURES_PATH)
+
+
+@pytest.fixture(scope="session")
+def large_array_text() -> str:
+    """Read the 100-item JSON array fixture once per test session."""
+    return (_FIXTURES_DIR / "large_array.json").read_text()
@@ -405,6 +405,11 @@ def test_server_config_id_uniqueness() -> None:
     # Same config should have same ID
     assert config1.id == config3.id
 
+    # The ID is computed once per instance and does not affect equality
+    assert config1.id is config1.id
+    assert config1 == config3
+    assert hash(config1) == hash(ServerConfig(command="echo", args=("hello",)))
+
 
 def test_virtual_tool_dataclass() -> None:
     """Test VirtualTool dataclass creation."""
@@ -8,6 +8,8 @@ Tests are based on real MCP server outputs captured from:
 """
 
 import json
+import typing as t
+
 import pytest
 
 from mcp_proxy.json_detector import (
@@ -16,14 +18,43 @@ from mcp_proxy.json_detector import (
 )
 
 
-# Load real server outputs
-@pytest.fixture
-def real_server_outputs() -> dict:
-    """Load real MCP server outputs from fixtures."""
-    import pathlib
-    fixtures_path = pathlib.Path(__file__).parent / "fixtures" / "mcp_server_outputs.json"
-    with open(fixtures_path) as f:
-        return json.load(f)
+def _subset(data: dict, keys: t.Iterable[str]) -> dict:
+    """Project data onto keys so a test can compare a whole dict at once.
+
+    Keys missing from data are left out rather than mapped to None, so the
+    comparison fails when an expected field was not extracted.
+    """
+    return {key: data[key] for key in keys if key in data}
+
+
+# Fixture keys whose text content holds JSON, with the fields each must yield
+# and any further keys that only need to be present.
+_EXTRACTION_CASES = [
+    (
+        "mcp_server_time_get_current_time",
+        {"timezone": "America/Los_Angeles", "day_of_week": "Tuesday", "is_dst": False},
+        ["datetime"],
+    ),
+    (
+        "mcp_server_fetch_api_json",
+        {
+            "name": "servers",
+            "full_name": "modelcontextprotocol/servers",
+            "description": "Model Context Protocol Servers",
+            "stargazers_count": 1892,
+        },
+        [],
+    ),
+    ("json_with_trailing_text", {"status": "complete", "count": 42}, []),
+]
+
+# Fixture keys whose text content is not JSON (markdown, malformed, plain text).
+_NO_EXTRACTION_KEYS = [
+    "mcp_server_fetch_html",
+    "server_github_search",
+    "malformed_json",
+    "server_memory_structured",
+]
 
 
 class TestDetectJsonInText:
@@ -191,16 +222,29 @@ This domain is for use in illustrative examples.
 class TestExtractJsonFromToolResult:
     """Tests for extract_json_from_tool_result function."""
 
-    def test_extract_from_mcp_time_server(self, real_server_outputs):
-        """Test extraction from real mcp-server-time output."""
-        tool_result = real_server_outputs["mcp_server_time_get_current_time"]
-        result = extract_json_from_tool_result(tool_result)
+    @pytest.mark.parametrize(
+        ("key", "expected", "present"),
+        _EXTRACTION_CASES,
+        ids=[key for key, _, _ in _EXTRACTION_CASES],
+    )
+    def test_extracts_expected_fields(self, real_server_outputs, key, expected, present):
+        """Test extraction from real server outputs that carry JSON in text."""
+        result = extract_json_from_tool_result(real_server_outputs[key])
 
         assert result is not None
-        assert result["timezone"] == "America/Los_Angeles"
-        assert result["day_of_week"] == "Tuesday"
-        assert result["is_dst"] is False
-        assert "datetime" in result
+        assert _subset(result, expected) == expected
+        for field in present:
+            assert field in result
+
+    @pytest.mark.parametrize("key", _NO_EXTRACTION_KEYS)
+    def test_no_extraction(self, real_server_outputs, key):
+        """Test that non-JSON text content returns None.
+
+        Note: server_memory_structured already has structuredContent; its text
+        is just "Created 2 entities". Integration code should check for
+        structuredContent first before attempting extraction.
+        """
+        assert extract_json_from_tool_result(real_server_outputs[key]) is None
 
     def test_extract_from_mcp_time_convert(self, real_server_outputs):
         """Test extraction from real mcp-server-time convert_time output."""
@@ -208,75 +252,16 @@ class TestExtractJsonFromToolResult:
         result = extract_json_from_tool_result(tool_result)
 
         assert result is not None
-        assert "source" in result
-        assert "target" in result
         assert result["source"]["timezone"] == "UTC"
         assert result["target"]["timezone"] == "Asia/Tokyo"
         assert result["time_difference"] == "+9.0h"
 
-    def test_extract_from_fetch_api_json(self, real_server_outputs):
-        """Test extraction from mcp-server-fetch with API endpoint."""
-        tool_result = real_server_outputs["mcp_server_fetch_api_json"]
-        result = extract_json_from_tool_result(tool_result)
-
-        assert result is not None
-        assert result["name"] == "servers"
-        assert result["full_name"] == "modelcontextprotocol/servers"
-        assert result["description"] == "Model Context Protocol Servers"
-        assert result["stargazers_count"] == 1892
-
-    def test_no_extraction_from_markdown(self, real_server_outputs):
-        """Test that markdown content returns None."""
-        tool_result = real_server_outputs["mcp_server_fetch_html"]
-        result = extract_json_from_tool_result(tool_result)
-
-        assert result is None
-
-    def test_no_extraction_from_github_list(self, real_server_outputs):
-        """Test that GitHub markdown list returns None."""
-        tool_result = real_server_outputs["server_github_search"]
-        result = extract_json_from_tool_result(tool_result)
-
-        assert result is None
-
     def test_extract_compact_array(self, real_server_outputs):
         """Test extraction of compact JSON array."""
         tool_result = real_server_outputs["compact_json_array"]
         result = extract_json_from_tool_result(tool_result)
 
-        assert result is not None
-        assert isinstance(result, list)
-        assert len(result) == 2
-        assert result[0]["name"] == "Alice"
-        assert result[1]["name"] == "Bob"
-
-    def test_no_extraction_from_malformed_json(self, real_server_outputs):
-        """Test that malformed JSON returns None."""
-        tool_result = real_server_outputs["malformed_json"]
-        result = extract_json_from_tool_result(tool_result)
-
-        assert result is None
-
-    def test_extract_json_with_trailing_text(self, real_server_outputs):
-        """Test extraction when JSON has trailing text."""
-        tool_result = real_server_outputs["json_with_trailing_text"]
-        result = extract_json_from_tool_result(tool_result)
-
-        assert result is not None
-        assert result["status"] == "complete"
-        assert result["count"] == 42
-
-    def test_no_extraction_when_structured_content_exists(self, real_server_outputs):
-        """Test behavior when tool result already has structuredContent.
-
-        Note: The detector still works, but integration code should check
-        for structuredContent first before attempting extraction.
-        """
-        tool_result = real_server_outputs["server_memory_structured"]
-        result = extract_json_from_tool_result(tool_result)
-
-        # The text content is just "Created 2 entities", not JSON
-        assert result is None
+        assert result == [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
 
     def test_invalid_tool_result_structure(self):
         """Test handling of invalid tool result structures."""
@@ -334,11 +319,10 @@ Second object:
         result = detect_json_in_text(text)
         assert result == {"a": {"b": {"c": {"d": {"e": {"f": "deep"}}}}}}
 
-    def test_large_json_array(self):
+    def test_large_json_array(self, large_array_text):
         """Test handling of large arrays."""
-        items = [{"id": i, "value": f"item_{i}"} for i in range(100)]
-        text = json.dumps(items)
-        result = detect_json_in_text(text)
+        items = json.loads(large_array_text)
+        result = detect_json_in_text(large_array_text)
         assert result == items
         assert len(result) == 100
 
@@ -358,45 +342,23 @@ Second object:
 class TestRealWorldIntegration:
     """Integration-style tests with real-world patterns."""
 
-    def test_time_server_workflow(self, real_server_outputs):
-        """Simulate full workflow with time server output."""
-        tool_result = real_server_outputs["mcp_server_time_get_current_time"]
+    @pytest.mark.parametrize(
+        ("key", "required_fields"),
+        [
+            ("mcp_server_time_get_current_time", ["timezone", "datetime"]),
+            ("mcp_server_fetch_api_json", ["name", "stargazers_count"]),
+            ("server_memory_structured", ["entities"]),
+        ],
+    )
+    def test_server_workflow(self, real_server_outputs, key, required_fields):
+        """Simulate the gateway workflow: prefer structuredContent, else extract JSON."""
+        tool_result = real_server_outputs[key]
 
-        # 1. Check if already has structuredContent
         if "structuredContent" in tool_result:
             structured = tool_result["structuredContent"]
         else:
-            # 2. Try JSON extraction
             structured = extract_json_from_tool_result(tool_result)
 
-        # 3. Verify we got data
         assert structured is not None
-        assert "timezone" in structured
-        assert "datetime" in structured
-
-    def test_fetch_server_workflow(self, real_server_outputs):
-        """Simulate workflow with fetch server API response."""
-        tool_result = real_server_outputs["mcp_server_fetch_api_json"]
-
-        if "structuredContent" not in tool_result:
-            structured = extract_json_from_tool_result(tool_result)
-        else:
-            structured = tool_result["structuredContent"]
-
-        assert structured is not None
-        assert "name" in structured
-        assert "stargazers_count" in structured
-
-    def test_memory_server_already_structured(self, real_server_outputs):
-        """Verify structured output is preferred over extraction."""
-        tool_result = real_server_outputs["server_memory_structured"]
-
-        # Should use existing structuredContent, not try extraction
-        if "structuredContent" in tool_result:
-            structured = tool_result["structuredContent"]
-        else:
-            structured = extract_json_from_tool_result(tool_result)
-
-        assert structured is not None
-        assert "entities" in structured
-
+        for field in required_fields:
+            assert field in structured
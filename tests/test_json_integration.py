@@ -6,7 +6,6 @@ Tests the complete workflow of:
 3. Applying output schema projections
 """
 
-import json
 import pytest
 
 from mcp_proxy.output_transformer import (
@@ -15,13 +14,79 @@ from mcp_proxy.output_transformer import (
 )
 
 
-@pytest.fixture
-def real_server_outputs() -> dict:
-    """Load real MCP server outputs from fixtures."""
-    import pathlib
-    fixtures_path = pathlib.Path(__file__).parent / "fixtures" / "mcp_server_outputs.json"
-    with open(fixtures_path) as f:
-        return json.load(f)
+# Output schemas shared by the projection tests. Declared once at module scope
+# so every test projects through the same schema objects.
+_TIME_SIMPLE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "timezone": {"type": "string"},
+        "day_of_week": {"type": "string"}
+    }
+}
+
+_TIME_CONVERT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "source_tz": {
+            "type": "string",
+            "source_field": "$.source.timezone"
+        },
+        "target_tz": {
+            "type": "string",
+            "source_field": "$.target.timezone"
+        },
+        "difference": {
+            "type": "string",
+            "source_field": "$.time_difference"
+        }
+    }
+}
+
+_FETCH_REPO_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "repository_name": {
+            "type": "string",
+            "source_field": "$.name"
+        },
+        "full_name": {
+            "type": "string",
+            "source_field": "$.full_name"
+        },
+        "stars": {
+            "type": "integer",
+            "source_field": "$.stargazers_count"
+        }
+    }
+}
+
+_TIME_SIMPLIFIED_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "time": {"type": "string", "source_field": "$.datetime"},
+        "tz": {"type": "string", "source_field": "$.timezone"}
+    }
+}
+
+_FETCH_METADATA_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "description": {"type": "string"},
+        "stargazers_count": {"type": "integer"}
+    }
+}
+
+_TIME_FLATTEN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "from_tz": {"type": "string", "source_field": "$.source.timezone"},
+        "from_time": {"type": "string", "source_field": "$.source.datetime"},
+        "to_tz": {"type": "string", "source_field": "$.target.timezone"},
+        "to_time": {"type": "string", "source_field": "$.target.datetime"},
+        "offset": {"type": "string", "source_field": "$.time_difference"}
+    }
+}
 
 
 class TestGetStructuredContent:
@@ -33,24 +98,19 @@ class TestGetStructuredContent:
         structured = get_structured_content(tool_result)
 
         # Should use structuredContent, not try to parse text
-        assert structured == {
-            "entities": [
-                {
-                    "name": "John_Smith",
-                    "entityType": "person",
-                    "observations": ["Works at Acme Corp"]
-                }
-            ]
-        }
+        assert structured == tool_result["structuredContent"]
 
     def test_extracts_json_when_no_structured_content(self, real_server_outputs):
         """Verify JSON extraction works when no structuredContent."""
         tool_result = real_server_outputs["mcp_server_time_get_current_time"]
         structured = get_structured_content(tool_result)
 
-        assert structured is not None
-        assert structured["timezone"] == "America/Los_Angeles"
-        assert "datetime" in structured
+        assert structured == {
+            "timezone": "America/Los_Angeles",
+            "datetime": "2025-12-23T08:40:38-08:00",
+            "day_of_week": "Tuesday",
+            "is_dst": False,
+        }
 
     def test_returns_none_for_non_json_text(self, real_server_outputs):
         """Verify returns None for markdown/non-JSON text."""
@@ -79,16 +139,7 @@ class TestApplyOutputProjectionToToolResult:
         """Test extracting and projecting time server output."""
         tool_result = real_server_outputs["mcp_server_time_get_current_time"]
 
-        # Define output schema to project only specific fields
-        output_schema = {
-            "type": "object",
-            "properties": {
-                "timezone": {"type": "string"},
-                "day_of_week": {"type": "string"}
-            }
-        }
-
-        result = apply_output_projection_to_tool_result(tool_result, output_schema)
+        result = apply_output_projection_to_tool_result(tool_result, _TIME_SIMPLE_SCHEMA)
 
         # Should have only projected fields
         assert result == {
@@ -102,26 +153,7 @@ class TestApplyOutputProjectionToToolResult:
         """Test projecting nested JSON structure."""
         tool_result = real_server_outputs["mcp_server_time_convert_time"]
 
-        # Project nested source/target times
-        output_schema = {
-            "type": "object",
-            "properties": {
-                "source_tz": {
-                    "type": "string",
-                    "source_field": "$.source.timezone"
-                },
-                "target_tz": {
-                    "type": "string",
-                    "source_field": "$.target.timezone"
-                },
-                "difference": {
-                    "type": "string",
-                    "source_field": "$.time_difference"
-                }
-            }
-        }
-
-        result = apply_output_projection_to_tool_result(tool_result, output_schema)
+        result = apply_output_projection_to_tool_result(tool_result, _TIME_CONVERT_SCHEMA)
 
         assert result == {
             "source_tz": "UTC",
@@ -133,26 +165,7 @@ class TestApplyOutputProjectionToToolResult:
         """Test extracting JSON from fetch server and projecting fields."""
         tool_result = real_server_outputs["mcp_server_fetch_api_json"]
 
-        # Project only relevant fields from GitHub API response
-        output_schema = {
-            "type": "object",
-            "properties": {
-                "repository_name": {
-                    "type": "string",
-                    "source_field": "$.name"
-                },
-                "full_name": {
-                    "type": "string",
-                    "source_field": "$.full_name"
-                },
-                "stars": {
-                    "type": "integer",
-                    "source_field": "$.stargazers_count"
-                }
-            }
-        }
-
-        result = apply_output_projection_to_tool_result(tool_result, output_schema)
+        result = apply_output_projection_to_tool_result(tool_result, _FETCH_REPO_SCHEMA)
 
         assert result == {
             "repository_name": "servers",
@@ -201,19 +214,17 @@ class TestApplyOutputProjectionToToolResult:
         """Test disabling JSON detection in full workflow."""
         tool_result = real_server_outputs["mcp_server_time_get_current_time"]
 
-        # With detection (default)
-        result = apply_output_projection_to_tool_result(
+        enabled_result = apply_output_projection_to_tool_result(
             tool_result,
             enable_json_detection=True
         )
-        assert "timezone" in result
-
-        # Without detection
-        result = apply_output_projection_to_tool_result(
+        disabled_result = apply_output_projection_to_tool_result(
             tool_result,
             enable_json_detection=False
         )
-        assert result == {}
+
+        assert "timezone" in enabled_result
+        assert disabled_result == {}
 
 
 class TestRealWorldWorkflows:
@@ -223,18 +234,9 @@ class TestRealWorldWorkflows:
         """Simulate creating a simplified time view for agents."""
         tool_result = real_server_outputs["mcp_server_time_get_current_time"]
 
-        # Virtual tool that simplifies time server output
-        simplified_schema = {
-            "type": "object",
-            "properties": {
-                "time": {"type": "string", "source_field": "$.datetime"},
-                "tz": {"type": "string", "source_field": "$.timezone"}
-            }
-        }
-
         result = apply_output_projection_to_tool_result(
             tool_result,
-            simplified_schema
+            _TIME_SIMPLIFIED_SCHEMA
         )
 
         assert result == {
@@ -246,52 +248,34 @@ class TestRealWorldWorkflows:
         """Simulate extracting just metadata from GitHub API response."""
         tool_result = real_server_outputs["mcp_server_fetch_api_json"]
 
-        # Extract just the metadata we care about
-        metadata_schema = {
-            "type": "object",
-            "properties": {
-                "name": {"type": "string"},
-                "description": {"type": "string"},
-                "stargazers_count": {"type": "integer"}
-            }
-        }
-
         result = apply_output_projection_to_tool_result(
             tool_result,
-            metadata_schema
+            _FETCH_METADATA_SCHEMA
         )
 
-        assert result["name"] == "servers"
-        assert result["description"] == "Model Context Protocol Servers"
-        assert result["stargazers_count"] == 1892
+        assert result == {
+            "name": "servers",
+            "description": "Model Context Protocol Servers",
+            "stargazers_count": 1892,
+        }
 
     def test_chain_of_transformations(self, real_server_outputs):
         """Test applying multiple layers of transformation."""
         tool_result = real_server_outputs["mcp_server_time_convert_time"]
 
-        # First projection: flatten structure
-        flattened_schema = {
-            "type": "object",
-            "properties": {
-                "from_tz": {"type": "string", "source_field": "$.source.timezone"},
-                "from_time": {"type": "string", "source_field": "$.source.datetime"},
-                "to_tz": {"type": "string", "source_field": "$.target.timezone"},
-                "to_time": {"type": "string", "source_field": "$.target.datetime"},
-                "offset": {"type": "string", "source_field": "$.time_difference"}
-            }
-        }
-
         result = apply_output_projection_to_tool_result(
             tool_result,
-            flattened_schema
+            _TIME_FLATTEN_SCHEMA
         )
 
-        # Verify flattened structure
-        assert result["from_tz"] == "UTC"
-        assert result["to_tz"] == "Asia/Tokyo"
-        assert result["offset"] == "+9.0h"
-        assert "source" not in result  # Nested structure removed
-        assert "target" not in result
+        # Verify flattened structure (nested source/target removed)
+        assert result == {
+            "from_tz": "UTC",
+            "from_time": "2025-12-23T12:00:00+00:00",
+            "to_tz": "Asia/Tokyo",
+            "to_time": "2025-12-23T21:00:00+09:00",
+            "offset": "+9.0h",
+        }
 
 
 class TestBackwardCompatibility:
@@ -304,8 +288,7 @@ class TestBackwardCompatibility:
         # No schema - should return structuredContent as-is
         result = apply_output_projection_to_tool_result(tool_result)
 
-        assert "entities" in result
-        assert len(result["entities"]) == 1
+        assert result == tool_result["structuredContent"]
 
     def test_projection_on_existing_structured_content(self, real_server_outputs):
         """Verify projections still work on structuredContent."""
@@ -330,15 +313,14 @@ class TestBackwardCompatibility:
 class TestErrorHandling:
     """Test error cases and edge conditions."""
 
-    def test_invalid_tool_result(self):
+    @pytest.mark.parametrize(
+        "bad_input",
+        [None, {}, {"content": []}],
+        ids=["none", "empty_dict", "empty_content"],
+    )
+    def test_invalid_tool_result(self, bad_input):
         """Test handling of invalid tool result structure."""
-        result = apply_output_projection_to_tool_result(None)  # type: ignore[arg-type]
-        assert result == {}
-
-        result = apply_output_projection_to_tool_result({})
-        assert result == {}
-
-        result = apply_output_projection_to_tool_result({"content": []})
+        result = apply_output_projection_to_tool_result(bad_input)  # type: ignore[arg-type]
         assert result == {}
 
     def test_malformed_json_in_text(self, real_server_outputs):
@@ -350,22 +332,15 @@ class TestErrorHandling:
         # Should return empty dict, not crash
         assert result == {}
 
-    def test_invalid_schema_graceful_handling(self, real_server_outputs):
-        """Test that invalid schemas don't crash."""
+    @pytest.mark.parametrize(
+        "schema",
+        [{"type": "object"}, {"invalid": "schema"}],
+        ids=["no_properties", "invalid_structure"],
+    )
+    def test_invalid_schema_graceful_handling(self, real_server_outputs, schema):
+        """Test that invalid schemas don't crash and return the original data."""
         tool_result = real_server_outputs["mcp_server_time_get_current_time"]
 
-        # Schema without properties
-        result = apply_output_projection_to_tool_result(
-            tool_result,
-            {"type": "object"}
-        )
-        # Should return original data
-        assert "timezone" in result
+        result = apply_output_projection_to_tool_result(tool_result, schema)
 
-        # Invalid schema structure
-        result = apply_output_projection_to_tool_result(
-            tool_result,
-            {"invalid": "schema"}
-        )
         assert "timezone" in result
-
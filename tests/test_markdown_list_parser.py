@@ -1,5 +1,7 @@
 """Tests for markdown list parser."""
 
+import typing as t
+
 import pytest
 from mcp_proxy.markdown_list_parser import (
     parse_numbered_list,
@@ -116,6 +118,21 @@ class TestParseNumberedList:
         assert result[0]["name"] == "name"
         assert result[1]["name"] == "another-name"
 
+    def test_required_field_declared_last_keeps_field_order(self) -> None:
+        """Test required fields are checked first without reordering the output."""
+        text = """
+1. #12 **first**
+2. #34 no title
+"""
+        patterns = {
+            "number": {"regex": r"#(\d+)", "type": "integer"},
+            "title": {"regex": r"\*\*([^*]+)\*\*", "required": True},
+        }
+        result = parse_numbered_list(text, patterns)
+
+        assert result == [{"number": 12, "title": "first"}]
+        assert list(result[0]) == ["number", "title"]
+
     def test_type_conversions(self):
         text = """
 1. Count: 42, Price: 19.99, Active: true
@@ -134,6 +151,31 @@ class TestParseNumberedList:
         assert result[0]["active"] is True
         assert result[1]["active"] is False
 
+    def test_malformed_transform_and_type_are_ignored(self) -> None:
+        """Test non-string transform and type values leave the match unchanged."""
+        text = "1. **Foo**"
+        patterns = {
+            "name": {"regex": r"\*\*([^*]+)\*\*", "transform": ["strip"], "type": ["integer"]},
+        }
+        result = parse_numbered_list(text, patterns)
+        assert result == [{"name": "Foo"}]
+
+    def test_overlapping_patterns_match_independently(self) -> None:
+        """Test each field pattern matches the whole item, even when they overlap."""
+        text = """
+1. **Fix #42 crash** - open
+2. **Add docs #7** - closed
+"""
+        patterns = {
+            "title": {"regex": r"\*\*([^*]+)\*\*", "required": True},
+            "number": {"regex": r"#(\d+)", "type": "integer"},
+        }
+        result = parse_numbered_list(text, patterns)
+        assert result == [
+            {"title": "Fix #42 crash", "number": 42},
+            {"title": "Add docs #7", "number": 7},
+        ]
+
     def test_empty_text(self):
         assert parse_numbered_list("", {"name": {"regex": r".*"}}) == []
         assert parse_numbered_list(None, {"name": {"regex": r".*"}}) == []
@@ -223,12 +265,7 @@ class TestExtractMarkdownList:
         assert result is None
 
 
-class TestRealWorldExamples:
-    """Tests with realistic MCP server output patterns."""
-
-    def test_brave_search_results(self):
-        """Simulated Brave search output."""
-        text = """Web search results for 'python asyncio':
+_BRAVE_TEXT = """Web search results for 'python asyncio':
 
 1. **Asyncio - Python Documentation**
    https://docs.python.org/3/library/asyncio.html
@@ -242,25 +279,18 @@ class TestRealWorldExamples:
    https://stackoverflow.com/questions/asyncio
    Common questions about Python's asyncio module.
 """
-        config = {
-            "parser": "markdown_numbered_list",
-            "list_field": "results",
-            "item_patterns": {
-                "title": {"regex": r"\*\*([^*]+)\*\*", "required": True},
-                "url": {"regex": r"https?://[^\s]+", "required": True},
-                "snippet": {"regex": r"^   ([^h].+)$", "multiline": True},
-            },
-        }
-        result = extract_markdown_list(text, config)
 
-        assert len(result["results"]) == 3
-        assert result["results"][0]["title"] == "Asyncio - Python Documentation"
-        assert "docs.python.org" in result["results"][0]["url"]
-        assert "concurrent code" in result["results"][0]["snippet"]
+_BRAVE_CONFIG = {
+    "parser": "markdown_numbered_list",
+    "list_field": "results",
+    "item_patterns": {
+        "title": {"regex": r"\*\*([^*]+)\*\*", "required": True},
+        "url": {"regex": r"https?://[^\s]+", "required": True},
+        "snippet": {"regex": r"^   ([^h].+)$", "multiline": True},
+    },
+}
 
-    def test_github_issues_list(self):
-        """Simulated GitHub issues output."""
-        text = """Open issues in anthropics/claude-code:
+_GITHUB_ISSUES_TEXT = """Open issues in anthropics/claude-code:
 
 1. **Feature: Add vim keybindings** (#234)
    Labels: enhancement, good-first-issue
@@ -274,16 +304,48 @@ class TestRealWorldExamples:
    Labels: documentation
    Created: 2025-01-03
 """
-        config = {
-            "parser": "markdown_numbered_list",
-            "list_field": "issues",
-            "item_patterns": {
-                "title": {"regex": r"\*\*([^*]+)\*\*", "required": True},
-                "number": {"regex": r"#(\d+)", "type": "integer"},
-                "labels": {"regex": r"Labels:\s*(.+)", "multiline": True},
-            },
-        }
-        result = extract_markdown_list(text, config)
+
+_GITHUB_ISSUES_CONFIG = {
+    "parser": "markdown_numbered_list",
+    "list_field": "issues",
+    "item_patterns": {
+        "title": {"regex": r"\*\*([^*]+)\*\*", "required": True},
+        "number": {"regex": r"#(\d+)", "type": "integer"},
+        "labels": {"regex": r"Labels:\s*(.+)", "multiline": True},
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def brave_case() -> tuple[str, dict[str, t.Any]]:
+    """Simulated Brave search output and its extraction config."""
+    return _BRAVE_TEXT, _BRAVE_CONFIG
+
+
+@pytest.fixture(scope="module")
+def github_issues_case() -> tuple[str, dict[str, t.Any]]:
+    """Simulated GitHub issues output and its extraction config."""
+    return _GITHUB_ISSUES_TEXT, _GITHUB_ISSUES_CONFIG
+
+
+class TestRealWorldExamples:
+    """Tests with realistic MCP server output patterns."""
+
+    def test_brave_search_results(self, brave_case: tuple[str, dict[str, t.Any]]) -> None:
+        """Simulated Brave search output."""
+        result = extract_markdown_list(*brave_case)
+
+        assert len(result["results"]) == 3
+        assert result["results"][0]["title"] == "Asyncio - Python Documentation"
+        assert "docs.python.org" in result["results"][0]["url"]
+        assert "concurrent code" in result["results"][0]["snippet"]
+
+    def test_github_issues_list(
+        self,
+        github_issues_case: tuple[str, dict[str, t.Any]],
+    ) -> None:
+        """Simulated GitHub issues output."""
+        result = extract_markdown_list(*github_issues_case)
 
         assert len(result["issues"]) == 3
         assert result["issues"][0]["title"] == "Feature: Add vim keybindings"
@@ -3,10 +3,14 @@
 
 import asyncio
 import contextlib
+import logging
+import socket
 import typing as t
-from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 import uvicorn
 from mcp import types
 from mcp.client.session import ClientSession
@@ -19,6 +23,7 @@ from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
+from mcp_proxy import mcp_server as mcp_server_module
 from mcp_proxy.mcp_server import MCPServerSettings, create_single_instance_routes, run_mcp_server
 
 
@@ -71,16 +76,33 @@ def create_starlette_app(
 class BackgroundServer(uvicorn.Server):
     """A test server that runs in a background thread."""
 
+    def __init__(self, config: uvicorn.Config) -> None:
+        """Initialize the server with no pending startup."""
+        super().__init__(config)
+        self._ready: asyncio.Future[bool] | None = None
+
     def install_signal_handlers(self) -> None:
         """Do not install signal handlers."""
 
+    async def startup(self, sockets: list[socket.socket] | None = None) -> None:
+        """Start the server, then resolve the ready future with the outcome."""
+        try:
+            await super().startup(sockets=sockets)
+        finally:
+            if self._ready is not None and not self._ready.done():
+                self._ready.set_result(self.started)
+
     @contextlib.asynccontextmanager
     async def run_in_background(self) -> t.AsyncIterator[None]:
         """Run the server in a background thread."""
+        self._ready = asyncio.get_running_loop().create_future()
         task = asyncio.create_task(self.serve())
         try:
-            while not self.started:  # noqa: ASYNC110
-                await asyncio.sleep(1e-3)
+            # serve() can also fail before it reaches startup, so wait on both
+            await asyncio.wait({self._ready, task}, return_when=asyncio.FIRST_COMPLETED)
+            if not (self._ready.done() and self._ready.result()):
+                msg = "Background server failed to start"
+                raise RuntimeError(msg)
             yield
         finally:
             self.should_exit = self.force_exit = True
@@ -90,13 +112,18 @@ class BackgroundServer(uvicorn.Server):
     def url(self) -> str:
         """Return the url of the started server."""
         hostport = next(
-            iter([socket.getsockname() for server in self.servers for socket in server.sockets]),
+            iter([sock.getsockname() for server in self.servers for sock in server.sockets]),
         )
         return f"http://{hostport[0]}:{hostport[1]}"
 
 
 def make_background_server(*, debug: bool = False, stateless: bool = False) -> BackgroundServer:
-    """Create a BackgroundServer instance with specified parameters."""
+    """Create a BackgroundServer instance with specified parameters.
+
+    The app is built fresh on every call rather than cached: its lifespan runs
+    StreamableHTTPSessionManager.run(), which may only be entered once per
+    manager, so an app cannot be served by a second uvicorn instance.
+    """
     mcp_server: Server[object, t.Any] = Server("TestServer")
 
     @mcp_server.list_prompts()  # type: ignore[misc,no-untyped-call]
@@ -139,38 +166,49 @@ def make_background_server(*, debug: bool = False, stateless: bool = False) -> B
     return BackgroundServer(config)
 
 
-async def test_sse_transport() -> None:
-    """Test basic glue code for the SSE transport and a fake MCP server."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def stateful_server() -> t.AsyncIterator[BackgroundServer]:
+    """A started server shared by the stateful transport tests.
+
+    Each test still opens its own client session, so tests stay isolated.
+    """
     server = make_background_server(debug=True)
     async with server.run_in_background():
-        sse_url = f"{server.url}/sse"
-        async with sse_client(url=sse_url) as streams, ClientSession(*streams) as session:
-            await session.initialize()
-            response = await session.list_prompts()
-            assert len(response.prompts) == 1
-            assert response.prompts[0].name == "prompt1"
+        yield server
 
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_sse_transport(stateful_server: BackgroundServer) -> None:
+    """Test basic glue code for the SSE transport and a fake MCP server."""
+    sse_url = f"{stateful_server.url}/sse"
+    async with sse_client(url=sse_url) as streams, ClientSession(*streams) as session:
+        await session.initialize()
+        response = await session.list_prompts()
+        assert len(response.prompts) == 1
+        assert response.prompts[0].name == "prompt1"
+
+
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.parametrize("path_suffix", ["/mcp/", "/mcp"])
-async def test_http_transport(path_suffix: str) -> None:
+async def test_http_transport(stateful_server: BackgroundServer, path_suffix: str) -> None:
     """Test HTTP transport layer functionality."""
-    server = make_background_server(debug=True)
-    async with server.run_in_background():
-        http_url = f"{server.url}{path_suffix}"
-        async with (
-            streamablehttp_client(url=http_url) as (read, write, _),
-            ClientSession(read, write) as session,
-        ):
-            await session.initialize()
-            response = await session.list_prompts()
-            assert len(response.prompts) == 1
-            assert response.prompts[0].name == "prompt1"
+    http_url = f"{stateful_server.url}{path_suffix}"
+    async with (
+        streamablehttp_client(url=http_url) as (read, write, _),
+        ClientSession(read, write) as session,
+    ):
+        await session.initialize()
+        response = await session.list_prompts()
+        assert len(response.prompts) == 1
+        assert response.prompts[0].name == "prompt1"
 
-            for i in range(3):
-                tool_result = await session.call_tool("echo", {"message": f"test_{i}"})
-                assert len(tool_result.content) == 1
-                assert isinstance(tool_result.content[0], types.TextContent)
-                assert tool_result.content[0].text == f"Echo: test_{i}"
+        tool_results = await asyncio.gather(
+            *(session.call_tool("echo", {"message": f"test_{i}"}) for i in range(3)),
+        )
+        for i, tool_result in enumerate(tool_results):
+            assert len(tool_result.content) == 1
+            assert isinstance(tool_result.content[0], types.TextContent)
+            assert tool_result.content[0].text == f"Echo: test_{i}"
 
 
 async def test_stateless_http_transport() -> None:
@@ -187,8 +225,10 @@ async def test_stateless_http_transport() -> None:
             assert len(response.prompts) == 1
             assert response.prompts[0].name == "prompt1"
 
-            for i in range(3):
-                tool_result = await session.call_tool("echo", {"message": f"test_{i}"})
+            tool_results = await asyncio.gather(
+                *(session.call_tool("echo", {"message": f"test_{i}"}) for i in range(3)),
+            )
+            for i, tool_result in enumerate(tool_results):
                 assert len(tool_result.content) == 1
                 assert isinstance(tool_result.content[0], types.TextContent)
                 assert tool_result.content[0].text == f"Echo: test_{i}"
@@ -220,24 +260,27 @@ def mock_stdio_params() -> StdioServerParameters:
     )
 
 
-def setup_async_context_mocks() -> tuple[
+AsyncContextMocks = tuple[
     contextlib.AbstractContextManager[tuple[AsyncMock, AsyncMock]],
     contextlib.AbstractContextManager[tuple[AsyncMock, AsyncMock]],
     AsyncMock,
     MagicMock,
     list[MagicMock],
-]:
-    """Helper function to set up async context manager mocks."""
+]
+
+
+@pytest.fixture
+def async_context_mocks() -> AsyncContextMocks:
+    """Fresh async context manager mocks for the backend clients and HTTP manager."""
     # Setup stdio client mock
     mock_streams = (AsyncMock(), AsyncMock())
 
     # Setup client session mock
-    mock_session = AsyncMock()
+    mock_session = AsyncMock(spec=ClientSession)
 
     # Setup HTTP manager mock
-    mock_http_manager = MagicMock()
-    session_manager = create_autospec(StreamableHTTPSessionManager, spec_set=True)
-    mock_http_manager.run.return_value = contextlib.nullcontext(session_manager)
+    mock_http_manager = MagicMock(spec=StreamableHTTPSessionManager)
+    mock_http_manager.run.return_value = contextlib.nullcontext()
     mock_routes = [MagicMock()]
 
     return (
@@ -257,9 +300,14 @@ def setup_async_context_mocks() -> tuple[
 from mcp_proxy.config_loader import ServerConfig, VirtualTool
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_server_config() -> ServerConfig:
-    """Create a mock ServerConfig for testing."""
+    """Create a mock ServerConfig for testing.
+
+    ServerConfig is frozen, so one instance is shared by the whole session.
+    VirtualTool is not: run_mcp_server records validation results on it, so
+    mock_virtual_tool stays function-scoped.
+    """
     return ServerConfig(
         command="echo",
         args=("hello",),
@@ -282,194 +330,138 @@ def mock_virtual_tool(mock_server_config: ServerConfig) -> VirtualTool:
     )
 
 
-async def test_run_mcp_server_empty_config(mock_settings: MCPServerSettings) -> None:
-    """Test run_mcp_server with empty configuration starts but has no tools."""
-    with (
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-    ):
-        mock_http_manager = MagicMock()
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = ([MagicMock()], mock_http_manager)
+@pytest.fixture
+def patched_mcp_server(
+    monkeypatch: pytest.MonkeyPatch,
+    async_context_mocks: AsyncContextMocks,
+) -> SimpleNamespace:
+    """Patch the backend clients, routes and uvicorn server used by run_mcp_server.
+
+    Returns a namespace of the mocks, already wired so that run_mcp_server can
+    connect to stdio backends and serve without touching the network.
+    """
+    mock_streams_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
+        async_context_mocks
+    )
 
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
+    mock_stdio_client = MagicMock(return_value=mock_streams_context)
+    mock_client_session = MagicMock(return_value=mock_session_context)
+    mock_create_routes = MagicMock(return_value=(mock_routes, mock_http_manager))
+    mock_server_instance = AsyncMock(spec=uvicorn.Server)
+    mock_uvicorn_server = MagicMock(return_value=mock_server_instance)
+
+    monkeypatch.setattr(mcp_server_module, "stdio_client", mock_stdio_client)
+    monkeypatch.setattr(mcp_server_module, "ClientSession", mock_client_session)
+    monkeypatch.setattr(mcp_server_module, "create_single_instance_routes", mock_create_routes)
+    monkeypatch.setattr(uvicorn, "Server", mock_uvicorn_server)
+
+    return SimpleNamespace(
+        stdio_client=mock_stdio_client,
+        client_session=mock_client_session,
+        streams_context=mock_streams_context,
+        session=mock_session,
+        create_routes=mock_create_routes,
+        uvicorn_server=mock_uvicorn_server,
+        server_instance=mock_server_instance,
+    )
 
-        # Run with empty config
-        await run_mcp_server(mock_settings, {}, [])
 
-        # Gateway should still be created and served
-        mock_create_routes.assert_called_once()
-        mock_server_instance.serve.assert_called_once()
+async def test_run_mcp_server_empty_config(
+    mock_settings: MCPServerSettings,
+    patched_mcp_server: SimpleNamespace,
+) -> None:
+    """Test run_mcp_server with empty configuration starts but has no tools."""
+    # Run with empty config
+    await run_mcp_server(mock_settings, {}, [])
+
+    # Gateway should still be created and served
+    patched_mcp_server.create_routes.assert_called_once()
+    patched_mcp_server.server_instance.serve.assert_called_once()
 
 
 async def test_run_mcp_server_with_stdio_backend(
     mock_settings: MCPServerSettings,
     mock_server_config: ServerConfig,
     mock_virtual_tool: VirtualTool,
+    patched_mcp_server: SimpleNamespace,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test run_mcp_server initializes stdio backend correctly."""
+    caplog.set_level(logging.INFO, logger="mcp_proxy.mcp_server")
     unique_servers = {mock_server_config.id: mock_server_config}
     virtual_tools = [mock_virtual_tool]
 
-    with (
-        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
-        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-        patch("mcp_proxy.mcp_server.logger") as mock_logger,
-    ):
-        # Setup mocks
-        mock_stdio_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
-            setup_async_context_mocks()
-        )
-        mock_stdio_client.return_value = mock_stdio_context
-        mock_client_session.return_value = mock_session_context
-
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = (mock_routes, mock_http_manager)
-
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
-
-        await run_mcp_server(mock_settings, unique_servers, virtual_tools)
+    await run_mcp_server(mock_settings, unique_servers, virtual_tools)
 
-        # Verify stdio_client was called
-        mock_stdio_client.assert_called_once()
-        call_args = mock_stdio_client.call_args[0][0]
-        assert call_args.command == "echo"
-        assert call_args.args == ["hello"]
-
-        # Verify logging
-        mock_logger.info.assert_any_call(
-            "Initializing stdio backend: %s %s",
-            "echo",
-            ("hello",),
-        )
+    # Verify stdio_client was called
+    mock_stdio_client = patched_mcp_server.stdio_client
+    mock_stdio_client.assert_called_once()
+    call_args = mock_stdio_client.call_args[0][0]
+    assert call_args.command == "echo"
+    assert call_args.args == ["hello"]
 
+    # Verify logging
+    assert "Initializing stdio backend: echo ('hello',)" in caplog.messages
 
-async def test_run_mcp_server_with_cors_middleware(
-    mock_server_config: ServerConfig,
-    mock_virtual_tool: VirtualTool,
-) -> None:
-    """Test run_mcp_server adds CORS middleware when allow_origins is set."""
-    settings_with_cors = MCPServerSettings(
-        bind_host="0.0.0.0",  # noqa: S104
-        port=9090,
-        allow_origins=["http://localhost:3000", "https://example.com"],
-    )
-    unique_servers = {mock_server_config.id: mock_server_config}
-    virtual_tools = [mock_virtual_tool]
 
-    with (
-        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
-        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("mcp_proxy.mcp_server.Starlette") as mock_starlette,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-    ):
-        mock_stdio_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
-            setup_async_context_mocks()
-        )
-        mock_stdio_client.return_value = mock_stdio_context
-        mock_client_session.return_value = mock_session_context
-
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = (mock_routes, mock_http_manager)
+def _assert_cors_middleware(mock_starlette: MagicMock, _mock_create_routes: MagicMock) -> None:
+    middleware = mock_starlette.call_args.kwargs["middleware"]
+    assert len(middleware) == 1
+    assert middleware[0].cls == CORSMiddleware
 
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
 
-        await run_mcp_server(settings_with_cors, unique_servers, virtual_tools)
+def _assert_debug(mock_starlette: MagicMock, _mock_create_routes: MagicMock) -> None:
+    assert mock_starlette.call_args.kwargs["debug"] is True
 
-        # Verify Starlette was called with middleware
-        mock_starlette.assert_called_once()
-        call_args = mock_starlette.call_args
-        middleware = call_args.kwargs["middleware"]
 
-        assert len(middleware) == 1
-        assert middleware[0].cls == CORSMiddleware
+def _assert_stateless(_mock_starlette: MagicMock, mock_create_routes: MagicMock) -> None:
+    mock_create_routes.assert_called_once()
+    assert mock_create_routes.call_args.kwargs["stateless_instance"] is True
 
 
-async def test_run_mcp_server_debug_mode(
-    mock_server_config: ServerConfig,
-    mock_virtual_tool: VirtualTool,
-) -> None:
-    """Test run_mcp_server with debug mode enabled."""
-    debug_settings = MCPServerSettings(
-        bind_host="127.0.0.1",
-        port=8080,
-        log_level="DEBUG",
-    )
-    unique_servers = {mock_server_config.id: mock_server_config}
-    virtual_tools = [mock_virtual_tool]
-
-    with (
-        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
-        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("mcp_proxy.mcp_server.Starlette") as mock_starlette,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-    ):
-        mock_stdio_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
-            setup_async_context_mocks()
-        )
-        mock_stdio_client.return_value = mock_stdio_context
-        mock_client_session.return_value = mock_session_context
-
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = (mock_routes, mock_http_manager)
-
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
-
-        await run_mcp_server(debug_settings, unique_servers, virtual_tools)
-
-        # Verify Starlette was called with debug=True
-        mock_starlette.assert_called_once()
-        call_args = mock_starlette.call_args
-        assert call_args.kwargs["debug"] is True
-
-
-async def test_run_mcp_server_stateless_mode(
+@pytest.mark.parametrize(
+    ("settings", "check"),
+    [
+        pytest.param(
+            MCPServerSettings(
+                bind_host="0.0.0.0",  # noqa: S104
+                port=9090,
+                allow_origins=["http://localhost:3000", "https://example.com"],
+            ),
+            _assert_cors_middleware,
+            id="cors_middleware",
+        ),
+        pytest.param(
+            MCPServerSettings(bind_host="127.0.0.1", port=8080, log_level="DEBUG"),
+            _assert_debug,
+            id="debug_mode",
+        ),
+        pytest.param(
+            MCPServerSettings(bind_host="127.0.0.1", port=8080, stateless=True),
+            _assert_stateless,
+            id="stateless_mode",
+        ),
+    ],
+)
+async def test_run_mcp_server_settings(
+    settings: MCPServerSettings,
+    check: t.Callable[[MagicMock, MagicMock], None],
     mock_server_config: ServerConfig,
     mock_virtual_tool: VirtualTool,
+    patched_mcp_server: SimpleNamespace,
 ) -> None:
-    """Test run_mcp_server with stateless mode enabled."""
-    stateless_settings = MCPServerSettings(
-        bind_host="127.0.0.1",
-        port=8080,
-        stateless=True,
-    )
+    """Test run_mcp_server passes CORS, debug and stateless settings through to the app."""
     unique_servers = {mock_server_config.id: mock_server_config}
     virtual_tools = [mock_virtual_tool]
 
-    with (
-        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
-        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-    ):
-        mock_stdio_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
-            setup_async_context_mocks()
-        )
-        mock_stdio_client.return_value = mock_stdio_context
-        mock_client_session.return_value = mock_session_context
-
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = (mock_routes, mock_http_manager)
-
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
-
-        await run_mcp_server(stateless_settings, unique_servers, virtual_tools)
+    with patch("mcp_proxy.mcp_server.Starlette") as mock_starlette:
+        await run_mcp_server(settings, unique_servers, virtual_tools)
 
-        # Verify create_single_instance_routes was called with stateless_instance=True
-        mock_create_routes.assert_called_once()
-        call_kwargs = mock_create_routes.call_args.kwargs
-        assert call_kwargs["stateless_instance"] is True
+    mock_starlette.assert_called_once()
+    check(mock_starlette, patched_mcp_server.create_routes)
 
 
+@pytest.mark.usefixtures("patched_mcp_server")
 async def test_run_mcp_server_uvicorn_config(
     mock_settings: MCPServerSettings,
     mock_server_config: ServerConfig,
@@ -479,41 +471,23 @@ async def test_run_mcp_server_uvicorn_config(
     unique_servers = {mock_server_config.id: mock_server_config}
     virtual_tools = [mock_virtual_tool]
 
-    with (
-        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
-        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("uvicorn.Config") as mock_uvicorn_config,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-    ):
-        mock_stdio_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
-            setup_async_context_mocks()
-        )
-        mock_stdio_client.return_value = mock_stdio_context
-        mock_client_session.return_value = mock_session_context
-
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = (mock_routes, mock_http_manager)
-
-        mock_config = MagicMock()
-        mock_uvicorn_config.return_value = mock_config
-
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
+    with patch("uvicorn.Config") as mock_uvicorn_config:
+        mock_uvicorn_config.return_value = MagicMock()
 
         await run_mcp_server(mock_settings, unique_servers, virtual_tools)
 
-        # Verify uvicorn.Config was called with correct parameters
-        mock_uvicorn_config.assert_called_once()
-        call_args = mock_uvicorn_config.call_args
+    # Verify uvicorn.Config was called with correct parameters
+    mock_uvicorn_config.assert_called_once()
+    call_args = mock_uvicorn_config.call_args
 
-        assert call_args.kwargs["host"] == mock_settings.bind_host
-        assert call_args.kwargs["port"] == mock_settings.port
-        assert call_args.kwargs["log_level"] == mock_settings.log_level.lower()
+    assert call_args.kwargs["host"] == mock_settings.bind_host
+    assert call_args.kwargs["port"] == mock_settings.port
+    assert call_args.kwargs["log_level"] == mock_settings.log_level.lower()
 
 
 async def test_run_mcp_server_multiple_backends(
     mock_settings: MCPServerSettings,
+    patched_mcp_server: SimpleNamespace,
 ) -> None:
     """Test run_mcp_server with multiple backend servers."""
     server1 = ServerConfig(command="server1", args=("--mode", "a"))
@@ -538,70 +512,37 @@ async def test_run_mcp_server_multiple_backends(
     )
     virtual_tools = [tool1, tool2]
 
-    with (
-        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
-        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-    ):
-        mock_stdio_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
-            setup_async_context_mocks()
-        )
-        mock_stdio_client.return_value = mock_stdio_context
-        mock_client_session.return_value = mock_session_context
-
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = (mock_routes, mock_http_manager)
-
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
-
-        await run_mcp_server(mock_settings, unique_servers, virtual_tools)
+    await run_mcp_server(mock_settings, unique_servers, virtual_tools)
 
-        # Verify both backends were initialized
-        assert mock_stdio_client.call_count == 2
+    # Verify both backends were initialized
+    assert patched_mcp_server.stdio_client.call_count == 2
 
 
+@pytest.mark.usefixtures("patched_mcp_server")
 async def test_run_mcp_server_sse_url_logging(
     mock_settings: MCPServerSettings,
     mock_server_config: ServerConfig,
     mock_virtual_tool: VirtualTool,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test run_mcp_server logs correct gateway URL."""
+    caplog.set_level(logging.INFO, logger="mcp_proxy.mcp_server")
     unique_servers = {mock_server_config.id: mock_server_config}
     virtual_tools = [mock_virtual_tool]
 
-    with (
-        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
-        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-        patch("mcp_proxy.mcp_server.logger") as mock_logger,
-    ):
-        mock_stdio_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
-            setup_async_context_mocks()
-        )
-        mock_stdio_client.return_value = mock_stdio_context
-        mock_client_session.return_value = mock_session_context
-
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = (mock_routes, mock_http_manager)
+    await run_mcp_server(mock_settings, unique_servers, virtual_tools)
 
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
-
-        await run_mcp_server(mock_settings, unique_servers, virtual_tools)
-
-        # Verify unified gateway URL was logged
-        mock_logger.info.assert_any_call(
-            "Serving Unified MCP Gateway on http://%s:%s/sse",
-            mock_settings.bind_host,
-            mock_settings.port,
-        )
+    # Verify unified gateway URL was logged
+    assert (
+        f"Serving Unified MCP Gateway on http://{mock_settings.bind_host}:{mock_settings.port}/sse"
+        in caplog.messages
+    )
 
 
 async def test_run_mcp_server_backend_failure_continues(
     mock_settings: MCPServerSettings,
+    patched_mcp_server: SimpleNamespace,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test run_mcp_server continues when a backend fails to initialize."""
     server_config = ServerConfig(command="failing-server")
@@ -615,34 +556,30 @@ async def test_run_mcp_server_backend_failure_continues(
     )
     virtual_tools = [tool]
 
-    with (
-        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-        patch("mcp_proxy.mcp_server.logger") as mock_logger,
-    ):
-        # Make stdio_client raise an exception
-        mock_stdio_client.side_effect = Exception("Backend connection failed")
-
-        mock_http_manager = MagicMock()
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = ([MagicMock()], mock_http_manager)
+    # Make stdio_client raise an exception
+    patched_mcp_server.stdio_client.side_effect = Exception("Backend connection failed")
 
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
-
-        # Should not raise - gateway should continue with failed backend
-        await run_mcp_server(mock_settings, unique_servers, virtual_tools)
+    # Should not raise - gateway should continue with failed backend
+    await run_mcp_server(mock_settings, unique_servers, virtual_tools)
 
-        # Verify exception was logged
-        mock_logger.exception.assert_called()
-        mock_server_instance.serve.assert_called_once()
+    # Verify exception was logged
+    failures = [
+        record
+        for record in caplog.records
+        if record.getMessage() == f"Failed to initialize backend server {server_config.id}"
+    ]
+    assert len(failures) == 1
+    assert failures[0].exc_info is not None
+    patched_mcp_server.server_instance.serve.assert_called_once()
 
 
 async def test_run_mcp_server_with_url_backend(
     mock_settings: MCPServerSettings,
+    patched_mcp_server: SimpleNamespace,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test run_mcp_server with URL-based (SSE) backend."""
+    caplog.set_level(logging.INFO, logger="mcp_proxy.mcp_server")
     server_config = ServerConfig(
         url="http://localhost:8080/sse",
         transport="sse",
@@ -657,32 +594,145 @@ async def test_run_mcp_server_with_url_backend(
     )
     virtual_tools = [tool]
 
-    with (
-        patch("mcp_proxy.mcp_server.sse_client") as mock_sse_client,
-        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
-        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
-        patch("uvicorn.Server") as mock_uvicorn_server,
-        patch("mcp_proxy.mcp_server.logger") as mock_logger,
-    ):
-        mock_sse_context, mock_session_context, mock_session, mock_http_manager, mock_routes = (
-            setup_async_context_mocks()
-        )
-        mock_sse_client.return_value = mock_sse_context
-        mock_client_session.return_value = mock_session_context
+    with patch("mcp_proxy.mcp_server.sse_client") as mock_sse_client:
+        mock_sse_client.return_value = patched_mcp_server.streams_context
 
-        mock_http_manager.run.return_value = contextlib.nullcontext()
-        mock_create_routes.return_value = (mock_routes, mock_http_manager)
+        await run_mcp_server(mock_settings, unique_servers, virtual_tools)
 
-        mock_server_instance = AsyncMock()
-        mock_uvicorn_server.return_value = mock_server_instance
+    # Verify sse_client was called (not stdio_client)
+    mock_sse_client.assert_called_once_with("http://localhost:8080/sse")
+    patched_mcp_server.stdio_client.assert_not_called()
 
-        await run_mcp_server(mock_settings, unique_servers, virtual_tools)
+    assert (
+        "Initializing remote backend: http://localhost:8080/sse (transport: sse)" in caplog.messages
+    )
+
+
+async def test_run_mcp_server_duplicate_tool_names_use_first_tool(
+    mock_settings: MCPServerSettings,
+    mock_server_config: ServerConfig,
+    patched_mcp_server: SimpleNamespace,
+) -> None:
+    """Test call_tool routes and projects with the first tool registered under a name."""
+    unique_servers = {mock_server_config.id: mock_server_config}
+    virtual_tools = [
+        VirtualTool(
+            name="lookup",
+            description="First",
+            input_schema={"type": "object"},
+            server_id=mock_server_config.id,
+            original_name="first_source",
+            output_schema={
+                "type": "object",
+                "properties": {"value": {"type": "string", "source_field": "$.first"}},
+            },
+        ),
+        VirtualTool(
+            name="lookup",
+            description="Second",
+            input_schema={"type": "object"},
+            server_id=mock_server_config.id,
+            original_name="second_source",
+            output_schema={
+                "type": "object",
+                "properties": {"value": {"type": "string", "source_field": "$.second"}},
+            },
+        ),
+    ]
+    patched_mcp_server.session.call_tool.return_value = types.CallToolResult(
+        content=[types.TextContent(type="text", text='{"first": "a", "second": "b"}')],
+    )
 
-        # Verify sse_client was called (not stdio_client)
-        mock_sse_client.assert_called_once_with("http://localhost:8080/sse")
+    await run_mcp_server(mock_settings, unique_servers, virtual_tools)
 
-        mock_logger.info.assert_any_call(
-            "Initializing remote backend: %s (transport: %s)",
-            "http://localhost:8080/sse",
-            "sse",
+    gateway = patched_mcp_server.create_routes.call_args.args[0]
+    handler = gateway.request_handlers[types.CallToolRequest]
+    response = await handler(
+        types.CallToolRequest(params=types.CallToolRequestParams(name="lookup", arguments={})),
+    )
+
+    patched_mcp_server.session.call_tool.assert_awaited_once_with("first_source", {})
+    assert response.root.structuredContent == {"value": "a"}
+
+
+async def test_run_mcp_server_duplicate_tool_names_validate_first_tool(
+    mock_settings: MCPServerSettings,
+    mock_server_config: ServerConfig,
+    patched_mcp_server: SimpleNamespace,
+) -> None:
+    """Test validation results land on the first tool registered under a name."""
+    unique_servers = {mock_server_config.id: mock_server_config}
+    virtual_tools = [
+        VirtualTool(
+            name="lookup",
+            description="First",
+            input_schema={"type": "object"},
+            server_id=mock_server_config.id,
+            original_name="first_source",
+            expected_schema_hash="sha256:stale",
+            validation_mode="strict",
+        ),
+        VirtualTool(
+            name="lookup",
+            description="Second",
+            input_schema={"type": "object"},
+            server_id=mock_server_config.id,
+            original_name="second_source",
+            expected_schema_hash="sha256:stale",
+            validation_mode="strict",
+        ),
+    ]
+    patched_mcp_server.session.list_tools.return_value = types.ListToolsResult(tools=[])
+
+    await run_mcp_server(mock_settings, unique_servers, virtual_tools)
+
+    assert [tool.validation_status for tool in virtual_tools] == ["error", "pending"]
+
+
+async def test_run_mcp_server_validates_backends_concurrently(
+    mock_settings: MCPServerSettings,
+    patched_mcp_server: SimpleNamespace,
+) -> None:
+    """Test that each backend is validated and list_tools calls overlap."""
+    servers = [ServerConfig(command="server-a"), ServerConfig(command="server-b")]
+    unique_servers = {server.id: server for server in servers}
+    tools = [
+        VirtualTool(
+            name=name,
+            description=None,
+            input_schema={"type": "object"},
+            server_id=server.id,
+            expected_schema_hash="sha256:stale",
+        )
+        for name, server in zip(("tool_a", "tool_b"), servers, strict=True)
+    ]
+    concurrency = SimpleNamespace(in_flight=0, peak=0)
+
+    def backend_listing(tool: VirtualTool) -> AsyncMock:
+        listed = types.ListToolsResult(
+            tools=[types.Tool(name=tool.name, inputSchema={"type": "object"})],
         )
+
+        async def list_tools() -> types.ListToolsResult:
+            concurrency.in_flight += 1
+            concurrency.peak = max(concurrency.peak, concurrency.in_flight)
+            # Yield so that list_tools calls issued together overlap
+            await asyncio.sleep(0)
+            concurrency.in_flight -= 1
+            return listed
+
+        backend = AsyncMock(spec=ClientSession)
+        backend.list_tools.side_effect = list_tools
+        return backend
+
+    backends = [backend_listing(tool) for tool in tools]
+    patched_mcp_server.client_session.side_effect = [
+        contextlib.nullcontext(backend) for backend in backends
+    ]
+
+    await run_mcp_server(mock_settings, unique_servers, tools)
+
+    for backend in backends:
+        backend.list_tools.assert_awaited_once()
+    assert concurrency.peak == 2
+    assert [tool.validation_status for tool in tools] == ["drift", "drift"]
@@ -23,6 +23,25 @@ from mcp.server import Server
 from mcp_proxy.proxy_server import ToolOverride
 from tests.test_sidecar_overrides import proxy_with_overrides_context, server
 
+# Every test opens and closes its own in-memory sessions, so they can all run
+# on one event loop instead of a fresh loop per test.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Nested weather payload returned by the backend in several tests. The backend
+# serializes it over the in-memory transport, so the proxy never sees (or
+# mutates) this object and it can be shared.
+_WEATHER_RESULT = types.CallToolResult(
+    content=[types.TextContent(type="text", text="Weather data")],
+    structuredContent={
+        "raw_sensor_dump": {
+            "data": {"temp": 72.5, "humidity": 45},
+            "description": "Partly cloudy",
+            "internal_station_code": "KPAL-7X"
+        },
+        "debug_info": {"request_id": "abc123"}
+    }
+)
+
 
 @pytest.fixture
 def tool_callback() -> AsyncMock:
@@ -74,7 +93,6 @@ def server_with_nested_output(server: Server[object], tool_callback: AsyncMock)
     return server
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_simple_nested_extraction(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -95,17 +113,7 @@ async def test_jsonpath_simple_nested_extraction(
     }
 
     # Backend returns nested structure
-    tool_callback.return_value = types.CallToolResult(
-        content=[types.TextContent(type="text", text="Weather data")],
-        structuredContent={
-            "raw_sensor_dump": {
-                "data": {"temp": 72.5, "humidity": 45},
-                "description": "Partly cloudy",
-                "internal_station_code": "KPAL-7X"
-            },
-            "debug_info": {"request_id": "abc123"}
-        }
-    )
+    tool_callback.return_value = _WEATHER_RESULT
 
     async with proxy_with_overrides_context(server_with_nested_output, overrides) as session:
         await session.initialize()
@@ -124,7 +132,6 @@ async def test_jsonpath_simple_nested_extraction(
         assert "debug_info" not in result.structuredContent
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_deeply_nested_extraction(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -148,17 +155,7 @@ async def test_jsonpath_deeply_nested_extraction(
         }
     }
 
-    tool_callback.return_value = types.CallToolResult(
-        content=[types.TextContent(type="text", text="Weather data")],
-        structuredContent={
-            "raw_sensor_dump": {
-                "data": {"temp": 72.5, "humidity": 45},
-                "description": "Partly cloudy",
-                "internal_station_code": "KPAL-7X"
-            },
-            "debug_info": {"request_id": "abc123"}
-        }
-    )
+    tool_callback.return_value = _WEATHER_RESULT
 
     async with proxy_with_overrides_context(server_with_nested_output, overrides) as session:
         await session.initialize()
@@ -176,7 +173,6 @@ async def test_jsonpath_deeply_nested_extraction(
         assert len(result.structuredContent) == 2
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_mixed_with_toplevel(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -228,7 +224,6 @@ async def test_jsonpath_mixed_with_toplevel(
         assert result.structuredContent["status"] == "success"
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_missing_source_field_omits_field(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -277,7 +272,6 @@ async def test_jsonpath_missing_source_field_omits_field(
         assert "wind_speed" not in result.structuredContent
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_array_index_access(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -324,7 +318,6 @@ async def test_jsonpath_array_index_access(
         assert result.structuredContent["second_reading"] == 105
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_array_map_extraction(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -372,7 +365,6 @@ async def test_jsonpath_array_map_extraction(
         assert "records" not in result.structuredContent
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_array_map_nested_extraction(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -416,7 +408,6 @@ async def test_jsonpath_array_map_nested_extraction(
         assert result.structuredContent["temperatures"] == [72.5, 68.0, 75.2]
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_array_map_with_missing_values(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -464,7 +455,6 @@ async def test_jsonpath_array_map_with_missing_values(
         assert result.structuredContent["emails"] == ["alice@example.com", "charlie@example.com"]
 
 
-@pytest.mark.asyncio
 async def test_jsonpath_array_to_array_of_objects(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
@@ -517,7 +507,6 @@ async def test_jsonpath_array_to_array_of_objects(
         assert result.structuredContent["contacts"] == expected
 
 
-@pytest.mark.asyncio
 async def test_output_schema_advertises_flattened_structure(
     server_with_nested_output: Server[object],
     tool_callback: AsyncMock
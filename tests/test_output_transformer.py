@@ -3,8 +3,11 @@
 import pytest
 
 from mcp_proxy.output_transformer import (
+    _compile_jsonpath,
     apply_output_projection,
+    compile_output_projection,
     extract_value,
+    project_output,
     strip_source_fields,
 )
 
@@ -73,6 +76,12 @@ class TestExtractValue:
         # Invalid JSONPath syntax should return None, not raise
         assert extract_value(data, "[invalid") is None
 
+    def test_compiled_path_is_reused(self) -> None:
+        """Test that repeated paths reuse the same parsed expression."""
+        assert _compile_jsonpath("$.user.name") is _compile_jsonpath("$.user.name")
+        assert extract_value({"user": {"name": "Alice"}}, "$.user.name") == "Alice"
+        assert extract_value({"user": {"name": "Bob"}}, "$.user.name") == "Bob"
+
 
 class TestApplyOutputProjection:
     """Tests for the apply_output_projection function."""
@@ -201,6 +210,54 @@ class TestApplyOutputProjection:
         assert apply_output_projection(content, {}) == content
         assert apply_output_projection(content, {"type": "object"}) == content
 
+    def test_compiled_projection_is_reusable(self) -> None:
+        """Test that one compiled plan projects many results like the schema does."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "temp": {"type": "number", "source_field": "$.data.temp"},
+                "status": {"type": "string"},
+            },
+        }
+        projection = compile_output_projection(schema)
+        for content in ({"data": {"temp": 72.5}, "status": "ok"}, {"data": {}}):
+            assert project_output(content, projection) == apply_output_projection(
+                content, schema
+            )
+        assert compile_output_projection({"type": "object"}) is None
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            {"data": {"temp": 72.5}},
+            {"data": {"temp": None}},
+            {"data": {}},
+            {"data": [{"temp": 72.5}]},
+            {"data": "not-a-dict"},
+        ],
+        ids=["present", "null", "missing", "list_parent", "scalar_parent"],
+    )
+    def test_dotted_path_matches_jsonpath(self, content) -> None:
+        """Test that plain dotted paths, walked directly, agree with jsonpath-ng."""
+        schema = {"properties": {"temp": {"source_field": "$.data.temp"}}}
+        result = project_output(content, compile_output_projection(schema))
+        assert result.get("temp") == extract_value(content, "$.data.temp")
+
+    @pytest.mark.parametrize(
+        "path",
+        ["$.items[0].id", "$.items[5].id", "$.items[*].id", "$.items[*].tags[*]", "$.name[0]"],
+        ids=["index", "index_out_of_range", "wildcard", "nested_wildcard", "index_on_string"],
+    )
+    def test_simple_path_matches_jsonpath(self, path) -> None:
+        """Test that index and wildcard paths, run as steps, agree with jsonpath-ng."""
+        content = {
+            "name": "abc",
+            "items": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}, {"tags": ["c"]}],
+        }
+        schema = {"properties": {"value": {"source_field": path}}}
+        result = project_output(content, compile_output_projection(schema))
+        assert result.get("value") == extract_value(content, path)
+
 
 class TestStripSourceFields:
     """Tests for the strip_source_fields function."""
@@ -1,18 +1,13 @@
-import shutil
 from pathlib import Path
-from typing import Generator
 import pytest
 from a2a.types import AgentSkill, AgentCapabilities
 from mcp_proxy.registry.agent_card import AgentCard
 from mcp_proxy.registry.storage import FileRegistryStorage
 
 @pytest.fixture
-def temp_registry_dir(tmp_path: Path) -> Generator[Path, None, None]:
-    """Provide a temporary directory for the registry."""
-    registry_dir = tmp_path / "registry"
-    yield registry_dir
-    if registry_dir.exists():
-        shutil.rmtree(registry_dir)
+def temp_registry_dir(tmp_path: Path) -> Path:
+    """Provide a temporary directory for the registry; pytest cleans up tmp_path."""
+    return tmp_path / "registry"
 
 @pytest.fixture
 def sample_card() -> AgentCard:
@@ -1,9 +1,10 @@
 """Tests for tool versioning and schema validation."""
 
 import json
+from collections.abc import Callable
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -18,7 +19,7 @@ from mcp_proxy.tool_versioning import (
 
 
 # Mock MCP Tool type for testing
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MockTool:
     """Mock MCP Tool for testing."""
 
@@ -245,11 +246,37 @@ class TestComputeVirtualToolHash:
         assert hash1 != hash3
 
 
+@pytest.fixture
+def make_backend() -> Callable[..., SimpleNamespace]:
+    """Factory for minimal backend stand-ins whose list_tools counts its calls."""
+
+    def factory(
+        tools: list[Any] | None = None,
+        raises: Exception | None = None,
+    ) -> SimpleNamespace:
+        backend = SimpleNamespace(list_tools_calls=0)
+
+        async def initialize() -> None:
+            pass
+
+        async def list_tools() -> SimpleNamespace:
+            backend.list_tools_calls += 1
+            if raises is not None:
+                raise raises
+            return SimpleNamespace(tools=tools or [])
+
+        backend.initialize = initialize
+        backend.list_tools = list_tools
+        return backend
+
+    return factory
+
+
 class TestValidateBackendTools:
     """Tests for validate_backend_tools function."""
 
     @pytest.mark.asyncio
-    async def test_validation_success(self):
+    async def test_validation_success(self, make_backend):
         """Successful validation when hashes match."""
         # Create a mock backend
         backend_tool = MockTool(
@@ -259,8 +286,7 @@ class TestValidateBackendTools:
         )
         expected_hash = compute_backend_tool_hash(backend_tool)
 
-        backend = AsyncMock()
-        backend.list_tools.return_value = MagicMock(tools=[backend_tool])
+        backend = make_backend([backend_tool])
 
         virtual_tool = VirtualTool(
             name="test_tool",
@@ -277,7 +303,7 @@ class TestValidateBackendTools:
         assert results[0].actual_hash == expected_hash
 
     @pytest.mark.asyncio
-    async def test_validation_drift(self):
+    async def test_validation_drift(self, make_backend):
         """Detection of schema drift when hashes don't match."""
         backend_tool = MockTool(
             name="test_tool",
@@ -285,8 +311,7 @@ class TestValidateBackendTools:
             inputSchema={"type": "object"},
         )
 
-        backend = AsyncMock()
-        backend.list_tools.return_value = MagicMock(tools=[backend_tool])
+        backend = make_backend([backend_tool])
 
         virtual_tool = VirtualTool(
             name="test_tool",
@@ -305,10 +330,9 @@ class TestValidateBackendTools:
         assert results[0].actual_hash != results[0].expected_hash
 
     @pytest.mark.asyncio
-    async def test_validation_missing_tool(self):
+    async def test_validation_missing_tool(self, make_backend):
         """Detection of missing backend tool."""
-        backend = AsyncMock()
-        backend.list_tools.return_value = MagicMock(tools=[])  # No tools
+        backend = make_backend([])  # No tools
 
         virtual_tool = VirtualTool(
             name="test_tool",
@@ -325,10 +349,9 @@ class TestValidateBackendTools:
         assert "not found" in results[0].error_message
 
     @pytest.mark.asyncio
-    async def test_validation_backend_error(self):
+    async def test_validation_backend_error(self, make_backend):
         """Handling of backend errors."""
-        backend = AsyncMock()
-        backend.list_tools.side_effect = Exception("Connection failed")
+        backend = make_backend(raises=Exception("Connection failed"))
 
         virtual_tool = VirtualTool(
             name="test_tool",
@@ -344,10 +367,9 @@ class TestValidateBackendTools:
         assert "Connection failed" in results[0].error_message
 
     @pytest.mark.asyncio
-    async def test_validation_skip_mode(self):
+    async def test_validation_skip_mode(self, make_backend):
         """Skip validation for tools with skip mode."""
-        backend = AsyncMock()
-        backend.list_tools.return_value = MagicMock(tools=[])
+        backend = make_backend([])
 
         virtual_tool = VirtualTool(
             name="test_tool",
@@ -361,10 +383,11 @@ class TestValidateBackendTools:
 
         assert len(results) == 1
         assert results[0].status == "valid"
-        # list_tools should still be called (we can't avoid it for other tools)
+        # Only skip-mode tools, so the backend is never queried
+        assert backend.list_tools_calls == 0
 
     @pytest.mark.asyncio
-    async def test_validation_with_original_name(self):
+    async def test_validation_with_original_name(self, make_backend):
         """Validation looks up tool by original_name if specified."""
         backend_tool = MockTool(
             name="backend_name",  # Different from virtual tool name
@@ -373,8 +396,7 @@ class TestValidateBackendTools:
         )
         expected_hash = compute_backend_tool_hash(backend_tool)
 
-        backend = AsyncMock()
-        backend.list_tools.return_value = MagicMock(tools=[backend_tool])
+        backend = make_backend([backend_tool])
 
         virtual_tool = VirtualTool(
             name="renamed_tool",  # Different from backend